@@ -3,9 +3,17 @@ Example usage of Evalys Launchpad Adapters
 """
 
 import asyncio
+
+try:
+    import uvloop  # uvloop>=0.18 for uvloop.run (the "uvloop" extra)
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
 from solders.keypair import Keypair
-from solders.pubkey import Pubkey
 from src.adapters.pumpfun_adapter import PumpFunAdapter
+from src.adapters.token_cache import TokenInfoCache
+from src.config.settings import Settings
+from src.utils.pubkey import pubkey_from_string
 from src.safety.allowlist import AllowlistManager
 
 
@@ -15,8 +23,12 @@ async def main():
     print("Evalys Launchpad Adapters - Example")
     print("=" * 60)
     
-    # Initialize adapter
-    adapter = PumpFunAdapter(rpc_url="https://api.devnet.solana.com")
+    # Initialize adapter; token info is cached at TOKEN_CACHE_PATH
+    token_cache = TokenInfoCache(Settings.TOKEN_CACHE_PATH)
+    adapter = PumpFunAdapter(rpc_url="https://api.devnet.solana.com", token_cache=token_cache)
+    
+    # Open the RPC connection in the background while the offline examples run
+    warmup_task = asyncio.create_task(adapter.warmup())
     
     try:
         # Example 1: Get adapter info
@@ -26,27 +38,32 @@ async def main():
         print(f"   RPC URL: {adapter.rpc_url}")
         print(f"   Validates program: {adapter.validate_program(program_id)}")
         
-        # Example 2: Get token info
+        # Example 2 & 3: Get token info and curve data
+        # Both lookups are independent RPCs, so issue them concurrently.
         print("\n📋 Example 2: Get Token Info")
         # Use actual token mint address for real data
-        token_mint = Pubkey.from_string("11111111111111111111111111111111")
-        try:
-            token_info = await adapter.get_token_info(token_mint)
+        token_mint = pubkey_from_string("11111111111111111111111111111111")
+        await warmup_task
+        info_task = asyncio.create_task(adapter.get_token_info_cached(token_mint))
+        curve_task = asyncio.create_task(adapter.get_curve_data(token_mint))
+        token_info, curve_data = await asyncio.gather(
+            info_task, curve_task, return_exceptions=True
+        )
+        
+        if isinstance(token_info, Exception):
+            print(f"   Error: {token_info}")
+        else:
             print(f"   Token Mint: {token_info.mint}")
             print(f"   Symbol: {token_info.symbol}")
             print(f"   Name: {token_info.name}")
-        except Exception as e:
-            print(f"   Error: {e}")
         
-        # Example 3: Get curve data
         print("\n📋 Example 3: Get Curve Data")
-        try:
-            curve_data = await adapter.get_curve_data(token_mint)
+        if isinstance(curve_data, Exception):
+            print(f"   Error: {curve_data}")
+        else:
             print(f"   Token Mint: {curve_data.token_mint}")
-            print(f"   Current Price: {curve_data.current_price} SOL")
-            print(f"   Liquidity: {curve_data.liquidity}")
-        except Exception as e:
-            print(f"   Error: {e}")
+            print(f"   Current Price: {curve_data.current_price_sol} SOL")
+            print(f"   Liquidity: {curve_data.liquidity_sol} SOL")
         
         # Example 4: Safety features
         print("\n📋 Example 4: Safety Features")
@@ -65,6 +82,7 @@ async def main():
         
     finally:
         await adapter.disconnect()
+        token_cache.close()
     
     print("\n" + "=" * 60)
     print("✅ Examples completed!")
@@ -75,5 +93,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
@@ -5,6 +5,7 @@ Demonstrates building a ghost sell transaction for Bonk.fun.
 Perfect for screen recordings and promotional videos.
 """
 
+import io
 import sys
 import time
 from datetime import datetime
@@ -13,53 +14,68 @@ from datetime import datetime
 import logging
 logging.getLogger().setLevel(logging.CRITICAL)
 
+# Demo output is buffered and written once per section, paced by
+# one sleep per section rather than per line
+_buffer = io.StringIO()
+
+def emit(text: str = ""):
+    """Buffer a line of demo output"""
+    _buffer.write(text + "\n")
+
+def flush(delay: float = 0.0):
+    """Write buffered output, then pause before the next section"""
+    sys.stdout.write(_buffer.getvalue())
+    sys.stdout.flush()
+    _buffer.seek(0)
+    _buffer.truncate()
+    if delay:
+        time.sleep(delay)
+
 def print_header(title: str, char: str = "="):
     """Print formatted header"""
     width = 70
-    print("\n" + char * width)
-    print(f"  {title}".center(width))
-    print(char * width + "\n")
+    emit("\n" + char * width)
+    emit(f"  {title}".center(width))
+    emit(char * width + "\n")
 
 def print_section(title: str):
     """Print section title"""
-    print(f"\n{'─' * 70}")
-    print(f"  {title}")
-    print(f"{'─' * 70}\n")
+    emit(f"\n{'─' * 70}")
+    emit(f"  {title}")
+    emit(f"{'─' * 70}\n")
 
 def print_success(message: str):
     """Print success message"""
-    print(f"     ✅ {message}")
-    time.sleep(0.2)
+    emit(f"     ✅ {message}")
 
 def print_info(message: str):
     """Print info message"""
-    print(f"     ℹ️  {message}")
-    time.sleep(0.2)
+    emit(f"     ℹ️  {message}")
 
 def print_data(label: str, value: str):
     """Print data label and value"""
-    print(f"     {label:.<30} {value}")
+    emit(f"     {label:.<30} {value}")
 
 def main():
     """Main demo function"""
     # Clear screen
-    print("\n" * 2)
+    emit("\n" * 2)
     
     # Header
     print_header("BONK.FUN GHOST SELL", "═")
-    print("  Building Privacy-Preserving Sell Transaction")
-    print(f"  Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    time.sleep(1)
+    emit("  Building Privacy-Preserving Sell Transaction")
+    emit(f"  Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    flush(1)
     
     # Overview
     print_section("OVERVIEW")
-    print("  This demo shows:")
-    print("    • Fetching curve state from on-chain")
-    print("    • Getting sell quote (expected output, slippage)")
-    print("    • Building sell transaction")
-    print("    • Simulating transaction")
-    print("    • Privacy-preserving configuration")
-    time.sleep(2)
+    emit("  This demo shows:")
+    emit("    • Fetching curve state from on-chain")
+    emit("    • Getting sell quote (expected output, slippage)")
+    emit("    • Building sell transaction")
+    emit("    • Simulating transaction")
+    emit("    • Privacy-preserving configuration")
+    flush(2)
     
     # Token Selection
     print_section("TOKEN SELECTION")
@@ -68,23 +84,23 @@ def main():
     print_data("Token Mint", token_mint[:32] + "...")
     print_data("Launchpad", "Bonk.fun")
     print_data("Program ID", "TBD (awaiting program details)")
-    print()
+    emit()
     print_info("Note: Bonk.fun adapter is in development")
-    time.sleep(1)
+    flush(1)
     
     # Implementation Status
     print_section("IMPLEMENTATION STATUS")
     
-    print("  ⏳ Bonk.fun Adapter Status:")
-    print("     • Framework: ✅ Complete")
-    print("     • Program ID: ⏳ Awaiting details")
-    print("     • Instructions: ⏳ Awaiting details")
-    print("     • Account Layout: ⏳ Awaiting details")
-    print("     • Transaction Building: ⏳ Planned")
-    print()
-    print("  📝 This demo shows the intended flow.")
-    print("     Full implementation requires Bonk.fun program details.")
-    time.sleep(2)
+    emit("  ⏳ Bonk.fun Adapter Status:")
+    emit("     • Framework: ✅ Complete")
+    emit("     • Program ID: ⏳ Awaiting details")
+    emit("     • Instructions: ⏳ Awaiting details")
+    emit("     • Account Layout: ⏳ Awaiting details")
+    emit("     • Transaction Building: ⏳ Planned")
+    emit()
+    emit("  📝 This demo shows the intended flow.")
+    emit("     Full implementation requires Bonk.fun program details.")
+    flush(2)
     
     # Intended Flow (Simulated)
     print_section("INTENDED FLOW (Simulated)")
@@ -100,7 +116,7 @@ def main():
     print_data("Current Price", f"{curve_state['current_price']:.6f} SOL")
     print_data("Total Supply", f"{curve_state['total_supply']:,.0f}")
     print_data("Market Cap", f"{curve_state['market_cap']:,.0f} SOL")
-    time.sleep(1)
+    flush(1)
     
     # Sell Quote (Simulated)
     print_section("SELL QUOTE (Simulated)")
@@ -127,9 +143,9 @@ def main():
     print_data("Price Impact", f"{quote['price_impact']:.2f}%")
     print_data("Slippage", f"{quote['slippage']:.1%}")
     print_data("Min Output", f"{quote['min_output']:.4f} SOL")
-    print()
+    emit()
     print_info(f"Expected to receive ~{quote['output_amount']:.4f} SOL for {quote['input_amount']:,.0f} tokens")
-    time.sleep(1.5)
+    flush(1.5)
     
     # Build Transaction (Simulated)
     print_section("BUILD TRANSACTION (Simulated)")
@@ -138,12 +154,12 @@ def main():
     print_data("Instructions", "TBD (awaiting program details)")
     print_data("Accounts", "TBD (awaiting program details)")
     print_data("Compute Units", "TBD")
-    print()
-    print("     Instruction Breakdown (intended):")
-    print("       • Sell instruction (Bonk.fun program)")
-    print("       • Compute budget instruction")
-    print("       • Priority fee instruction")
-    time.sleep(1.5)
+    emit()
+    emit("     Instruction Breakdown (intended):")
+    emit("       • Sell instruction (Bonk.fun program)")
+    emit("       • Compute budget instruction")
+    emit("       • Priority fee instruction")
+    flush(1.5)
     
     # Privacy Configuration
     print_section("PRIVACY CONFIGURATION")
@@ -161,45 +177,48 @@ def main():
     if privacy_config["order_slicing"]:
         print_data("Number of Slices", str(privacy_config["num_slices"]))
     print_data("Timing Jitter", f"{privacy_config['timing_jitter_ms']}ms")
-    time.sleep(1.5)
+    flush(1.5)
     
     # Summary
     print_section("SUMMARY")
     
-    print("  Bonk.fun Adapter Status")
-    print()
-    print("  Implementation:")
-    print("    • Framework: ✅ Complete")
-    print("    • Program Details: ⏳ Awaiting")
-    print("    • Transaction Building: ⏳ Planned")
-    print()
-    print("  Intended Features:")
-    print("    • Sell quote calculation")
-    print("    • Sell transaction building")
-    print("    • Privacy-preserving configuration")
-    print("    • Transaction simulation")
-    print()
-    print("  📝 Note: Full implementation requires:")
-    print("     • Bonk.fun program ID")
-    print("     • Instruction details")
-    print("     • Account layout")
-    print("     • PDA derivation")
-    print()
+    emit("  Bonk.fun Adapter Status")
+    emit()
+    emit("  Implementation:")
+    emit("    • Framework: ✅ Complete")
+    emit("    • Program Details: ⏳ Awaiting")
+    emit("    • Transaction Building: ⏳ Planned")
+    emit()
+    emit("  Intended Features:")
+    emit("    • Sell quote calculation")
+    emit("    • Sell transaction building")
+    emit("    • Privacy-preserving configuration")
+    emit("    • Transaction simulation")
+    emit()
+    emit("  📝 Note: Full implementation requires:")
+    emit("     • Bonk.fun program ID")
+    emit("     • Instruction details")
+    emit("     • Account layout")
+    emit("     • PDA derivation")
+    emit()
     
     # Footer
     print_header("DEMO COMPLETE", "═")
-    print("  Bonk.fun Ghost Sell - Adapter in Development")
-    print("  See docs/adapter-interface.md for adapter interface")
-    print("  See src/adapters/bonkfun/README.md for Bonk.fun status")
-    print()
+    emit("  Bonk.fun Ghost Sell - Adapter in Development")
+    emit("  See docs/adapter-interface.md for adapter interface")
+    emit("  See src/adapters/bonkfun/README.md for Bonk.fun status")
+    emit()
+    flush()
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
+        flush()
         print("\n\n  Demo interrupted by user.")
         sys.exit(0)
     except Exception as e:
+        flush()
         print(f"\n\n  Error during demo: {e}")
         import traceback
         traceback.print_exc()
@@ -5,6 +5,7 @@ Demonstrates building a ghost buy transaction for Pump.fun.
 Perfect for screen recordings and promotional videos.
 """
 
+import io
 import sys
 import time
 from datetime import datetime
@@ -13,53 +14,68 @@ from datetime import datetime
 import logging
 logging.getLogger().setLevel(logging.CRITICAL)
 
+# Demo output is buffered and written once per section, paced by
+# one sleep per section rather than per line
+_buffer = io.StringIO()
+
+def emit(text: str = ""):
+    """Buffer a line of demo output"""
+    _buffer.write(text + "\n")
+
+def flush(delay: float = 0.0):
+    """Write buffered output, then pause before the next section"""
+    sys.stdout.write(_buffer.getvalue())
+    sys.stdout.flush()
+    _buffer.seek(0)
+    _buffer.truncate()
+    if delay:
+        time.sleep(delay)
+
 def print_header(title: str, char: str = "="):
     """Print formatted header"""
     width = 70
-    print("\n" + char * width)
-    print(f"  {title}".center(width))
-    print(char * width + "\n")
+    emit("\n" + char * width)
+    emit(f"  {title}".center(width))
+    emit(char * width + "\n")
 
 def print_section(title: str):
     """Print section title"""
-    print(f"\n{'─' * 70}")
-    print(f"  {title}")
-    print(f"{'─' * 70}\n")
+    emit(f"\n{'─' * 70}")
+    emit(f"  {title}")
+    emit(f"{'─' * 70}\n")
 
 def print_success(message: str):
     """Print success message"""
-    print(f"     ✅ {message}")
-    time.sleep(0.2)
+    emit(f"     ✅ {message}")
 
 def print_info(message: str):
     """Print info message"""
-    print(f"     ℹ️  {message}")
-    time.sleep(0.2)
+    emit(f"     ℹ️  {message}")
 
 def print_data(label: str, value: str):
     """Print data label and value"""
-    print(f"     {label:.<30} {value}")
+    emit(f"     {label:.<30} {value}")
 
 def main():
     """Main demo function"""
     # Clear screen
-    print("\n" * 2)
+    emit("\n" * 2)
     
     # Header
     print_header("PUMP.FUN GHOST BUY", "═")
-    print("  Building Privacy-Preserving Buy Transaction")
-    print(f"  Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    time.sleep(1)
+    emit("  Building Privacy-Preserving Buy Transaction")
+    emit(f"  Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    flush(1)
     
     # Overview
     print_section("OVERVIEW")
-    print("  This demo shows:")
-    print("    • Fetching curve state from on-chain")
-    print("    • Getting buy quote (expected output, slippage)")
-    print("    • Building buy transaction")
-    print("    • Simulating transaction")
-    print("    • Privacy-preserving configuration")
-    time.sleep(2)
+    emit("  This demo shows:")
+    emit("    • Fetching curve state from on-chain")
+    emit("    • Getting buy quote (expected output, slippage)")
+    emit("    • Building buy transaction")
+    emit("    • Simulating transaction")
+    emit("    • Privacy-preserving configuration")
+    flush(2)
     
     # Token Selection
     print_section("TOKEN SELECTION")
@@ -68,7 +84,7 @@ def main():
     print_data("Token Mint", token_mint[:32] + "...")
     print_data("Launchpad", "Pump.fun")
     print_data("Program ID", "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
-    time.sleep(1)
+    flush(1)
     
     # Fetch Curve State
     print_section("FETCH CURVE STATE")
@@ -91,7 +107,7 @@ def main():
     print_data("Real SOL Reserves", f"{curve_state['real_sol_reserves']:.2f} SOL")
     print_data("Total Supply", f"{curve_state['total_supply']:,.0f}")
     print_data("Market Cap", f"{curve_state['market_cap']:,.0f} SOL")
-    time.sleep(1.5)
+    flush(1.5)
     
     # Buy Quote
     print_section("BUY QUOTE")
@@ -119,9 +135,9 @@ def main():
     print_data("Slippage", f"{quote['slippage']:.1%}")
     print_data("Fee", f"{quote['fee']:.4f} SOL")
     print_data("Min Output", f"{quote['min_output']:,.0f} tokens")
-    print()
+    emit()
     print_info(f"Expected to receive ~{quote['output_amount']:,.0f} tokens for {quote['input_amount']:.4f} SOL")
-    time.sleep(1.5)
+    flush(1.5)
     
     # Build Transaction
     print_section("BUILD TRANSACTION")
@@ -141,12 +157,12 @@ def main():
     print_data("Compute Units", f"{transaction_info['compute_units']:,}")
     print_data("Priority Fee", f"{transaction_info['priority_fee']:,} lamports")
     print_data("Recent Blockhash", transaction_info["recent_blockhash"][:16] + "...")
-    print()
-    print("     Instruction Breakdown:")
-    print("       • Buy instruction (Pump.fun program)")
-    print("       • Compute budget instruction")
-    print("       • Priority fee instruction")
-    time.sleep(1.5)
+    emit()
+    emit("     Instruction Breakdown:")
+    emit("       • Buy instruction (Pump.fun program)")
+    emit("       • Compute budget instruction")
+    emit("       • Priority fee instruction")
+    flush(1.5)
     
     # Privacy Configuration
     print_section("PRIVACY CONFIGURATION")
@@ -167,7 +183,7 @@ def main():
     if privacy_config["order_slicing"]:
         print_data("Number of Slices", str(privacy_config["num_slices"]))
     print_data("Timing Jitter", f"{privacy_config['timing_jitter_ms']}ms")
-    time.sleep(1.5)
+    flush(1.5)
     
     # Simulate Transaction
     print_section("SIMULATE TRANSACTION")
@@ -185,9 +201,9 @@ def main():
     print_data("Compute Units Used", f"{simulation['compute_units']:,}")
     print_data("Account Changes", str(simulation["account_changes"]))
     print_data("Logs", f"{len(simulation['logs'])} log entries")
-    print()
+    emit()
     print_info("Simulation passed - transaction is valid")
-    time.sleep(1.5)
+    flush(1.5)
     
     # Transaction Payload
     print_section("TRANSACTION PAYLOAD")
@@ -199,52 +215,55 @@ def main():
     print_data("Transaction Size", "~250 bytes")
     print_data("Signature", signature[:32] + "... (simulated)")
     print_data("Status", "Ready to sign and send")
-    print()
-    print("     Next Steps:")
-    print("       1. Sign transaction with wallet")
-    print("       2. Submit via Execution Engine")
-    print("       3. Monitor confirmation")
-    time.sleep(1.5)
+    emit()
+    emit("     Next Steps:")
+    emit("       1. Sign transaction with wallet")
+    emit("       2. Submit via Execution Engine")
+    emit("       3. Monitor confirmation")
+    flush(1.5)
     
     # Summary
     print_section("SUMMARY")
     
-    print("  Ghost Buy Transaction Prepared")
-    print()
-    print("  Key Details:")
-    print(f"    • Token: {token_mint[:16]}...")
-    print(f"    • Input: {quote['input_amount']:.4f} SOL")
-    print(f"    • Expected Output: {quote['output_amount']:,.0f} tokens")
-    print(f"    • Price Impact: {quote['price_impact']:.2f}%")
-    print(f"    • Privacy: Burner wallet + order slicing")
-    print()
-    print("  Transaction Status:")
-    print("    • Built: ✅")
-    print("    • Simulated: ✅")
-    print("    • Privacy Configured: ✅")
-    print("    • Ready to Submit: ✅")
-    print()
-    print("  📝 Note: This is a demonstration.")
-    print("     Actual transaction requires:")
-    print("     • Real Solana RPC connection")
-    print("     • Funded wallet")
-    print("     • On-chain program interaction")
-    print()
+    emit("  Ghost Buy Transaction Prepared")
+    emit()
+    emit("  Key Details:")
+    emit(f"    • Token: {token_mint[:16]}...")
+    emit(f"    • Input: {quote['input_amount']:.4f} SOL")
+    emit(f"    • Expected Output: {quote['output_amount']:,.0f} tokens")
+    emit(f"    • Price Impact: {quote['price_impact']:.2f}%")
+    emit(f"    • Privacy: Burner wallet + order slicing")
+    emit()
+    emit("  Transaction Status:")
+    emit("    • Built: ✅")
+    emit("    • Simulated: ✅")
+    emit("    • Privacy Configured: ✅")
+    emit("    • Ready to Submit: ✅")
+    emit()
+    emit("  📝 Note: This is a demonstration.")
+    emit("     Actual transaction requires:")
+    emit("     • Real Solana RPC connection")
+    emit("     • Funded wallet")
+    emit("     • On-chain program interaction")
+    emit()
     
     # Footer
     print_header("DEMO COMPLETE", "═")
-    print("  Pump.fun Ghost Buy - Privacy-Preserving Transaction Building")
-    print("  See docs/adapter-interface.md for adapter interface")
-    print("  See src/adapters/pumpfun/README.md for Pump.fun details")
-    print()
+    emit("  Pump.fun Ghost Buy - Privacy-Preserving Transaction Building")
+    emit("  See docs/adapter-interface.md for adapter interface")
+    emit("  See src/adapters/pumpfun/README.md for Pump.fun details")
+    emit()
+    flush()
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
+        flush()
         print("\n\n  Demo interrupted by user.")
         sys.exit(0)
     except Exception as e:
+        flush()
         print(f"\n\n  Error during demo: {e}")
         import traceback
         traceback.print_exc()
@@ -32,6 +32,16 @@ setup(
     python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
+        "numpy": [
+            "numpy>=1.24",
+        ],
+        "pybase64": [
+            "pybase64>=1.3",
+        ],
+        "uvloop": [
+            # uvloop.run was added in 0.18
+            "uvloop>=0.18; sys_platform != 'win32'",
+        ],
         "dev": [
             "pytest>=7.4.3",
             "pytest-asyncio>=0.21.1",
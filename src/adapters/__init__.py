@@ -2,12 +2,33 @@
 Evalys Launchpad Adapters
 
 Adapters for different memecoin launchpad platforms (Pump.fun, Bonk.fun, etc.)
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one adapter does not pay for loading the others.
 """
 
-from .base_adapter import LaunchpadAdapter, CurveData, TokenInfo
-from .pumpfun_adapter import PumpFunAdapter
-from .bonkfun_adapter import BonkFunAdapter
-from .generic_adapter import GenericAdapter
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_adapter import LaunchpadAdapter, CurveData, TokenInfo
+    from .pumpfun_adapter import PumpFunAdapter
+    from .bonkfun_adapter import BonkFunAdapter
+    from .generic_adapter import GenericAdapter
+    from .token_cache import TokenInfoCache
+    from ..utils.pubkey import pubkey_from_string
+
+# Public name -> module that defines it, relative to this package
+_LAZY_IMPORTS = {
+    "LaunchpadAdapter": ".base_adapter",
+    "CurveData": ".base_adapter",
+    "TokenInfo": ".base_adapter",
+    "PumpFunAdapter": ".pumpfun_adapter",
+    "BonkFunAdapter": ".bonkfun_adapter",
+    "GenericAdapter": ".generic_adapter",
+    "TokenInfoCache": ".token_cache",
+    "pubkey_from_string": "..utils.pubkey",
+}
 
 __all__ = [
     "LaunchpadAdapter",
@@ -16,7 +37,23 @@ __all__ = [
     "PumpFunAdapter",
     "BonkFunAdapter",
     "GenericAdapter",
+    "TokenInfoCache",
+    "pubkey_from_string",
 ]
 
 __version__ = "0.1.0"
 
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
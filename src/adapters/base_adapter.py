@@ -4,41 +4,139 @@ Base Adapter
 Abstract base class for launchpad adapters.
 """
 
+import asyncio
+import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import (
+    Optional, Dict, Any, List, Sequence, Hashable, Callable, Awaitable, TypeVar, TYPE_CHECKING
+)
+from solders.hash import Hash
+from solders.instruction import Instruction
 from solders.keypair import Keypair
+from solders.message import Message
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
+from solana.rpc.async_api import AsyncClient
 from ..utils.logger import get_logger
+from ..utils.pubkey import find_program_address, pubkey_from_string
+
+if TYPE_CHECKING:
+    from .token_cache import TokenInfoCache
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# SPL token mint account layout
+MINT_ACCOUNT_SIZE = 82
+MINT_DECIMALS_OFFSET = 44
+
+# Metaplex token metadata program; the metadata account for a mint is the
+# PDA of [b"metadata", program, mint]
+METADATA_PROGRAM_ID = pubkey_from_string("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
+METADATA_SEED = b"metadata"
+
+# Metadata account: key (u8), update authority and mint (32 bytes each),
+# then name, symbol and uri as u32 length-prefixed, NUL-padded strings
+METADATA_STRINGS_OFFSET = 1 + 32 + 32
+_U32 = struct.Struct("<I")
+
+# Maximum number of accounts per getMultipleAccounts request
+MAX_MULTIPLE_ACCOUNTS = 100
+
+LAMPORTS_PER_SOL = 1_000_000_000
+
+# Fixed-point scale for CurveData.current_price_lamports
+PRICE_SCALE = 1_000_000_000
+
+# RPC request timeout (seconds)
+RPC_TIMEOUT = 30
+
+# HTTP connection pool limits; with HTTP/2, concurrent requests multiplex
+# over the pooled connections instead of opening new ones
+RPC_MAX_CONNECTIONS = 64
+RPC_MAX_KEEPALIVE_CONNECTIONS = 32
 
-@dataclass
+
+def _ws_url_for(rpc_url: str) -> str:
+    """Derive the websocket endpoint that pairs with an HTTP RPC endpoint"""
+    if rpc_url.startswith("https://"):
+        return "wss://" + rpc_url[len("https://"):]
+    if rpc_url.startswith("http://"):
+        return "ws://" + rpc_url[len("http://"):]
+    return rpc_url
+
+
+def create_rpc_client(rpc_url: str) -> AsyncClient:
+    """
+    Create an HTTP/2, keep-alive pooled RPC client
+    
+    One client can be shared by several adapters (see the client argument
+    of LaunchpadAdapter) so their requests multiplex over one pool.
+    
+    Args:
+        rpc_url: Solana RPC endpoint
+        
+    Returns:
+        AsyncClient instance
+    """
+    return AsyncClient(
+        rpc_url,
+        timeout=RPC_TIMEOUT,
+        http2=True,
+        max_connections=RPC_MAX_CONNECTIONS,
+        max_keepalive_connections=RPC_MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class CurveData:
     """
     Bonding curve data
     
+    Amounts are kept as integers in on-chain units (lamports and token base
+    units) so quote math stays exact; use the *_sol properties for display.
+    
     Attributes:
         token_mint: Token mint address
-        current_price: Current price in SOL
+        current_price_lamports: Price of one whole token in lamports,
+            fixed-point scaled by PRICE_SCALE
         slope: Curve slope
-        liquidity: Available liquidity
-        total_supply: Total token supply
-        market_cap: Market capitalization
+        liquidity_lamports: Available liquidity in lamports
+        total_supply: Total token supply in base units
+        market_cap_lamports: Market capitalization in lamports
         timestamp: Data timestamp
+        virtual_sol_reserves: Virtual SOL reserves in lamports
+        virtual_token_reserves: Virtual token reserves in base units
     """
     token_mint: Pubkey
-    current_price: float
+    current_price_lamports: int
     slope: float
-    liquidity: float
-    total_supply: float
-    market_cap: float
+    liquidity_lamports: int
+    total_supply: int
+    market_cap_lamports: int
     timestamp: float
+    virtual_sol_reserves: int = 0
+    virtual_token_reserves: int = 0
+    
+    @property
+    def current_price_sol(self) -> float:
+        """Price of one whole token in SOL"""
+        return self.current_price_lamports / (PRICE_SCALE * LAMPORTS_PER_SOL)
+    
+    @property
+    def liquidity_sol(self) -> float:
+        """Available liquidity in SOL"""
+        return self.liquidity_lamports / LAMPORTS_PER_SOL
+    
+    @property
+    def market_cap_sol(self) -> float:
+        """Market capitalization in SOL"""
+        return self.market_cap_lamports / LAMPORTS_PER_SOL
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
     """
     Token information
@@ -49,12 +147,14 @@ class TokenInfo:
         name: Token name
         uri: Token metadata URI
         created_at: Creation timestamp
+        decimals: Token decimals
     """
     mint: Pubkey
     symbol: str
     name: str
     uri: Optional[str] = None
     created_at: Optional[float] = None
+    decimals: Optional[int] = None
 
 
 class LaunchpadAdapter(ABC):
@@ -64,17 +164,117 @@ class LaunchpadAdapter(ABC):
     All launchpad adapters must implement these methods.
     """
     
-    def __init__(self, program_id: Pubkey, rpc_url: str = "https://api.mainnet-beta.solana.com"):
+    def __init__(
+        self,
+        program_id: Pubkey,
+        rpc_url: str = "https://api.mainnet-beta.solana.com",
+        token_cache: Optional["TokenInfoCache"] = None,
+        client: Optional[AsyncClient] = None
+    ):
         """
         Initialize adapter
         
         Args:
             program_id: Launchpad program ID
             rpc_url: Solana RPC endpoint
+            token_cache: Optional disk cache for token info lookups
+            client: Optional shared RPC client; the adapter creates (and
+                owns) its own when omitted
         """
         self.program_id = program_id
         self.rpc_url = rpc_url
-        logger.info(f"{self.__class__.__name__} initialized with program: {program_id}")
+        self.ws_url = _ws_url_for(rpc_url)
+        self.token_cache = token_cache
+        
+        # Reuse the HTTP connection across calls; a shared client is left
+        # open on disconnect since other adapters may still be using it
+        self._owns_client = client is None
+        self.client: Optional[AsyncClient] = client or self._create_client()
+        
+        # In-flight fetches by key, shared by concurrent callers
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        
+        logger.info("%s initialized with program: %s", self.__class__.__name__, program_id)
+    
+    def _create_client(self) -> AsyncClient:
+        """Create this adapter's own RPC client"""
+        return create_rpc_client(self.rpc_url)
+    
+    async def connect(self):
+        """
+        Connect to Solana RPC
+        
+        Adapters hold a client from construction, so RPC methods do not
+        call this per request. Call it once at start-up, and again to
+        re-open the client after disconnect.
+        """
+        # No await between the check and the assignment, so concurrent
+        # callers cannot both create a client and no lock is needed
+        if self.client is None:
+            self.client = self._create_client()
+            logger.debug("Connected to Solana RPC")
+    
+    async def warmup(self):
+        """
+        Open the RPC connection ahead of the first real request
+        
+        Issues a cheap getVersion call so the TCP/TLS handshake is done by
+        the time the first user-visible RPC goes out. Run it as a task to
+        overlap the handshake with other start-up work. Failures are logged,
+        not raised.
+        """
+        await self.connect()
+        
+        try:
+            await self.client.get_version()
+            logger.debug("Solana RPC connection warmed up")
+        except Exception as e:
+            logger.warning("RPC warmup failed: %s", e)
+    
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a fetch once for all concurrent callers with the same key
+        
+        If a fetch for key is already in flight, await its result instead
+        of issuing a duplicate RPC.
+        
+        Args:
+            key: Request key, e.g. ("curve_data", token_mint)
+            fetch: Zero-argument callable returning the fetch coroutine
+            
+        Returns:
+            Result of the shared fetch
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            
+            def _done(done: asyncio.Future):
+                # Mark the exception retrieved, so a fetch whose callers were
+                # all cancelled does not log "exception was never retrieved"
+                if not done.cancelled():
+                    done.exception()
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+            
+            future.add_done_callback(_done)
+        
+        # Shield so one caller's cancellation does not cancel the shared fetch
+        return await asyncio.shield(future)
+    
+    async def disconnect(self):
+        """
+        Disconnect from Solana RPC (closes the client if adapter-owned)
+        
+        Only call this at shutdown: closing the client drops its pooled
+        keep-alive connections, so the next request would pay for a new
+        TCP/TLS handshake.
+        """
+        if self.client and self._owns_client:
+            await self.client.close()
+            self.client = None
+            logger.debug("Disconnected from Solana RPC")
     
     @abstractmethod
     async def get_curve_data(self, token_mint: Pubkey) -> CurveData:
@@ -146,6 +346,192 @@ class LaunchpadAdapter(ABC):
         """
         pass
     
+    async def get_token_info_cached(self, token_mint: Pubkey) -> TokenInfo:
+        """
+        Get token information, served from the token cache when possible
+        
+        Falls through to get_token_info on a cache miss and stores the
+        result. Behaves like get_token_info when no cache is configured.
+        Cache reads and writes run in a worker thread, off the event loop.
+        
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            TokenInfo instance
+        """
+        if self.token_cache is not None:
+            token_info = await asyncio.to_thread(self.token_cache.get, token_mint)
+            if token_info is not None:
+                return token_info
+        
+        token_info = await self.get_token_info(token_mint)
+        
+        if self.token_cache is not None:
+            await asyncio.to_thread(self.token_cache.put, token_info)
+        
+        return token_info
+    
+    async def get_token_infos(self, mints: List[Pubkey]) -> List[Optional[TokenInfo]]:
+        """
+        Get token information for many mints at once
+        
+        Mint accounts are fetched with getMultipleAccounts, so N lookups
+        cost one RPC round-trip per 100 distinct mints instead of N.
+        Repeated mints are fetched once.
+        
+        Args:
+            mints: Token mint addresses
+            
+        Returns:
+            TokenInfo per mint, in order (None if the account does not exist
+            or is not a mint account)
+        """
+        unique_mints = list(dict.fromkeys(mints))
+        batches = [
+            unique_mints[start:start + MAX_MULTIPLE_ACCOUNTS]
+            for start in range(0, len(unique_mints), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        
+        responses = await asyncio.gather(
+            *(self.client.get_multiple_accounts(batch) for batch in batches)
+        )
+        
+        token_infos: Dict[Pubkey, Optional[TokenInfo]] = {}
+        for batch, resp in zip(batches, responses):
+            for mint, account in zip(batch, resp.value):
+                if account is None:
+                    token_infos[mint] = None
+                    continue
+                try:
+                    token_infos[mint] = self._parse_mint_account(mint, account.data)
+                except ValueError as e:
+                    logger.warning("Skipping %s: %s", mint, e)
+                    token_infos[mint] = None
+        
+        return [token_infos[mint] for mint in mints]
+    
+    async def _fetch_mint_with_metadata(self, token_mint: Pubkey) -> TokenInfo:
+        """
+        Fetch a mint and its Metaplex metadata in one RPC
+        
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            TokenInfo with decimals, plus name/symbol/uri when the token
+            has a metadata account
+            
+        Raises:
+            ValueError: If the mint account does not exist
+        """
+        resp = await self.client.get_multiple_accounts(
+            [token_mint, self._metadata_pda(token_mint)]
+        )
+        mint_account, metadata_account = resp.value
+        if mint_account is None:
+            raise ValueError(f"Mint account not found: {token_mint}")
+        
+        token_info = self._parse_mint_account(token_mint, mint_account.data)
+        if metadata_account is not None:
+            self._parse_metadata_account(token_info, metadata_account.data)
+        return token_info
+    
+    def _sign_transaction(
+        self,
+        instructions: Sequence[Instruction],
+        signer: Keypair,
+        recent_blockhash: Hash
+    ) -> Transaction:
+        """
+        Build a transaction paid for and signed by a single keypair
+        
+        Compiles the message once and signs its bytes directly, which is
+        markedly cheaper than Transaction.new_signed_with_payer.
+        
+        Args:
+            instructions: Instructions to include
+            signer: Fee payer and only signer
+            recent_blockhash: Recent blockhash
+            
+        Returns:
+            Signed transaction
+        """
+        message = Message.new_with_blockhash(instructions, signer.pubkey(), recent_blockhash)
+        return Transaction.populate(message, [signer.sign_message(bytes(message))])
+    
+    def _metadata_pda(self, token_mint: Pubkey) -> Pubkey:
+        """
+        Derive the Metaplex metadata PDA for a token
+        
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            Metadata account address
+        """
+        metadata_pda, _ = find_program_address(
+            (METADATA_SEED, bytes(METADATA_PROGRAM_ID), bytes(token_mint)),
+            METADATA_PROGRAM_ID
+        )
+        return metadata_pda
+    
+    def _parse_metadata_account(self, token_info: TokenInfo, data: bytes):
+        """
+        Fill name, symbol and uri from a Metaplex metadata account
+        
+        Args:
+            token_info: TokenInfo to update in place
+            data: Raw metadata account data
+            
+        Raises:
+            ValueError: If data is truncated
+        """
+        fields = []
+        offset = METADATA_STRINGS_OFFSET
+        try:
+            for _ in range(3):
+                (length,) = _U32.unpack_from(data, offset)
+                offset += _U32.size
+                if offset + length > len(data):
+                    raise struct.error("string exceeds account data")
+                fields.append(
+                    bytes(data[offset:offset + length]).decode("utf-8", "replace").rstrip("\x00")
+                )
+                offset += length
+        except struct.error as e:
+            raise ValueError(f"Invalid metadata account for {token_info.mint}") from e
+        
+        token_info.name, token_info.symbol, token_info.uri = fields
+    
+    def _parse_mint_account(self, mint: Pubkey, data: bytes) -> TokenInfo:
+        """
+        Parse an SPL token mint account into TokenInfo
+        
+        Mint accounts carry no name/symbol (those live in the metadata
+        account), so only decimals are populated here.
+        
+        Args:
+            mint: Token mint address
+            data: Raw mint account data
+            
+        Returns:
+            TokenInfo instance
+            
+        Raises:
+            ValueError: If data is not a mint account
+        """
+        if len(data) < MINT_ACCOUNT_SIZE:
+            raise ValueError(f"Account {mint} is not a token mint")
+        
+        return TokenInfo(
+            mint=mint,
+            symbol="",
+            name="",
+            uri=None,
+            decimals=data[MINT_DECIMALS_OFFSET]
+        )
+    
     def validate_program(self, program_id: Pubkey) -> bool:
         """
         Validate that program ID matches adapter's program
@@ -158,6 +544,19 @@ class LaunchpadAdapter(ABC):
         """
         return program_id == self.program_id
     
+    def validate_programs(self, program_ids: Sequence[Pubkey]) -> List[bool]:
+        """
+        Validate many program IDs against adapter's program
+        
+        Args:
+            program_ids: Program IDs to validate
+            
+        Returns:
+            One flag per program ID, True if valid
+        """
+        expected = self.program_id
+        return [program_id == expected for program_id in program_ids]
+    
     def get_program_id(self) -> Pubkey:
         """
         Get adapter's program ID
@@ -8,7 +8,10 @@ from typing import Optional
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
+from solana.rpc.async_api import AsyncClient
 from .base_adapter import LaunchpadAdapter, CurveData, TokenInfo
+from .token_cache import TokenInfoCache
+from ..config.settings import Settings
 from ..safety.allowlist import AllowlistManager
 from ..safety.validator import InstructionValidator
 from ..safety.sanitizer import BehaviorSanitizer
@@ -17,8 +20,8 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 # Bonk.fun Program ID
-# Update with actual program ID when available
-BONK_FUN_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+# Set via the BONK_FUN_PROGRAM_ID environment variable when available
+BONK_FUN_PROGRAM_ID = Settings.BONK_FUN_PROGRAM_PUBKEY
 
 
 class BonkFunAdapter(LaunchpadAdapter):
@@ -29,7 +32,9 @@ class BonkFunAdapter(LaunchpadAdapter):
     def __init__(
         self,
         rpc_url: str = "https://api.mainnet-beta.solana.com",
-        allowlist_manager: Optional[AllowlistManager] = None
+        allowlist_manager: Optional[AllowlistManager] = None,
+        token_cache: Optional[TokenInfoCache] = None,
+        client: Optional[AsyncClient] = None
     ):
         """
         Initialize Bonk.fun adapter
@@ -37,11 +42,13 @@ class BonkFunAdapter(LaunchpadAdapter):
         Args:
             rpc_url: Solana RPC endpoint
             allowlist_manager: Optional allowlist manager
+            token_cache: Optional disk cache for token info lookups
+            client: Optional shared RPC client (see create_rpc_client)
         """
-        super().__init__(BONK_FUN_PROGRAM_ID, rpc_url)
+        super().__init__(BONK_FUN_PROGRAM_ID, rpc_url, token_cache, client)
         
         self.allowlist = allowlist_manager or AllowlistManager()
-        self.validator = InstructionValidator()
+        self.validator = InstructionValidator(self.program_id)
         self.sanitizer = BehaviorSanitizer()
         
         # Add Bonk.fun program to allowlist
@@ -53,15 +60,15 @@ class BonkFunAdapter(LaunchpadAdapter):
         """Get bonding curve data for Bonk.fun token"""
         # Similar implementation to PumpFunAdapter
         # TODO: Implement Bonk.fun specific logic
-        logger.debug(f"Fetching Bonk.fun curve data for {token_mint}")
+        logger.debug("Fetching Bonk.fun curve data for %s", token_mint)
         
         return CurveData(
             token_mint=token_mint,
-            current_price=0.0,
+            current_price_lamports=0,
             slope=0.0,
-            liquidity=0.0,
-            total_supply=0.0,
-            market_cap=0.0,
+            liquidity_lamports=0,
+            total_supply=0,
+            market_cap_lamports=0,
             timestamp=0.0
         )
     
@@ -75,7 +82,7 @@ class BonkFunAdapter(LaunchpadAdapter):
         """Build buy token transaction for Bonk.fun"""
         # Similar to PumpFunAdapter but with Bonk.fun specific logic
         # TODO: Implement Bonk.fun buy instruction
-        logger.info(f"Building Bonk.fun buy transaction for {token_mint}")
+        logger.info("Building Bonk.fun buy transaction for %s", token_mint)
         raise NotImplementedError("Bonk.fun adapter not fully implemented yet")
     
     async def sell_token(
@@ -88,18 +95,18 @@ class BonkFunAdapter(LaunchpadAdapter):
         """Build sell token transaction for Bonk.fun"""
         # Similar to PumpFunAdapter but with Bonk.fun specific logic
         # TODO: Implement Bonk.fun sell instruction
-        logger.info(f"Building Bonk.fun sell transaction for {token_mint}")
+        logger.info("Building Bonk.fun sell transaction for %s", token_mint)
         raise NotImplementedError("Bonk.fun adapter not fully implemented yet")
     
     async def get_token_info(self, token_mint: Pubkey) -> TokenInfo:
         """Get token information for Bonk.fun"""
-        # Similar to PumpFunAdapter
-        logger.debug(f"Fetching Bonk.fun token info for {token_mint}")
-        
-        return TokenInfo(
-            mint=token_mint,
-            symbol="",
-            name="",
-            uri=None
+        return await self._coalesce(
+            ("token_info", token_mint),
+            lambda: self._fetch_token_info(token_mint)
         )
-
+    
+    async def _fetch_token_info(self, token_mint: Pubkey) -> TokenInfo:
+        """Fetch the Bonk.fun token mint and metadata accounts"""
+        logger.debug("Fetching Bonk.fun token info for %s", token_mint)
+        
+        return await self._fetch_mint_with_metadata(token_mint)
@@ -0,0 +1,143 @@
+"""
+Curve Table
+
+Column-oriented (NumPy) storage for bonding curve state of many tokens.
+
+Requires the optional ``numpy`` dependency.
+"""
+
+from typing import List, Optional, Sequence
+import numpy as np
+from solders.account import Account
+from solders.pubkey import Pubkey
+from .base_adapter import LAMPORTS_PER_SOL
+from .layouts import (
+    CURVE_ACCOUNT_MIN_SIZE, CURVE_COMPLETE_OFFSET, CURVE_FIELD_COUNT, CURVE_HEADER_SIZE
+)
+
+
+class CurveTable:
+    """
+    Bonding curve state for N tokens, one NumPy array per field
+
+    Lets scanners run price/market-cap math over all tokens as vectorized
+    NumPy operations instead of looping over CurveData objects.
+
+    Attributes:
+        mints: Mint addresses as raw bytes, uint8[N, 32]
+        virtual_token_reserves: Virtual token reserves in base units, int64[N]
+        virtual_sol_reserves: Virtual SOL reserves in lamports, int64[N]
+        real_token_reserves: Real token reserves in base units, int64[N]
+        real_sol_reserves: Real SOL reserves in lamports, int64[N]
+        total_supply: Total token supply in base units, int64[N]
+        complete: Whether the curve has completed, bool[N]
+        valid: Whether curve data was found for the row, bool[N]
+    """
+
+    def __init__(self, n: int):
+        """
+        Initialize an empty (all invalid) table
+
+        Args:
+            n: Number of rows
+        """
+        self.mints = np.zeros((n, 32), dtype=np.uint8)
+        self.virtual_token_reserves = np.zeros(n, dtype=np.int64)
+        self.virtual_sol_reserves = np.zeros(n, dtype=np.int64)
+        self.real_token_reserves = np.zeros(n, dtype=np.int64)
+        self.real_sol_reserves = np.zeros(n, dtype=np.int64)
+        self.total_supply = np.zeros(n, dtype=np.int64)
+        self.complete = np.zeros(n, dtype=bool)
+        self.valid = np.zeros(n, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @classmethod
+    def from_rpc(
+        cls,
+        mints: Sequence[Pubkey],
+        accounts: Sequence[Optional[Account]]
+    ) -> "CurveTable":
+        """
+        Build a table from a getMultipleAccounts response
+
+        Args:
+            mints: Token mint addresses
+            accounts: Bonding curve accounts, aligned with mints
+                (e.g. ``resp.value`` of get_multiple_accounts)
+
+        Returns:
+            CurveTable instance; rows without a curve account are invalid
+        """
+        table = cls(len(mints))
+        if not mints:
+            return table
+
+        table.mints[:] = np.frombuffer(
+            b"".join(bytes(mint) for mint in mints), dtype=np.uint8
+        ).reshape(-1, 32)
+
+        rows: List[int] = [
+            i for i, account in enumerate(accounts)
+            if account is not None and len(account.data) >= CURVE_ACCOUNT_MIN_SIZE
+        ]
+        if not rows:
+            return table
+
+        # One copy of the fixed-size field region per account, decoded in a single pass
+        fields = np.frombuffer(
+            b"".join(accounts[i].data[CURVE_HEADER_SIZE:CURVE_COMPLETE_OFFSET] for i in rows),
+            dtype="<u8"
+        ).reshape(-1, CURVE_FIELD_COUNT).astype(np.int64)
+
+        table.virtual_token_reserves[rows] = fields[:, 0]
+        table.virtual_sol_reserves[rows] = fields[:, 1]
+        table.real_token_reserves[rows] = fields[:, 2]
+        table.real_sol_reserves[rows] = fields[:, 3]
+        table.total_supply[rows] = fields[:, 4]
+        table.complete[rows] = [accounts[i].data[CURVE_COMPLETE_OFFSET] != 0 for i in rows]
+        table.valid[rows] = True
+
+        return table
+
+    def mint(self, row: int) -> Pubkey:
+        """
+        Get the mint address of a row
+
+        Args:
+            row: Row index
+
+        Returns:
+            Mint address
+        """
+        return Pubkey.from_bytes(self.mints[row].tobytes())
+
+    def price_sol(self, decimals: int = 6) -> np.ndarray:
+        """
+        Spot price of one whole token in SOL, per row
+
+        Computed in float64; rows without reserves are 0.
+
+        Args:
+            decimals: Token decimals
+
+        Returns:
+            float64[N] prices
+        """
+        vsol = self.virtual_sol_reserves.astype(np.float64)
+        vtok = self.virtual_token_reserves.astype(np.float64)
+        price = np.divide(vsol, vtok, out=np.zeros(len(self), dtype=np.float64), where=vtok > 0)
+        return price * (10 ** decimals) / LAMPORTS_PER_SOL
+
+    def market_cap_sol(self, decimals: int = 6) -> np.ndarray:
+        """
+        Market capitalization in SOL, per row
+
+        Args:
+            decimals: Token decimals
+
+        Returns:
+            float64[N] market caps
+        """
+        return self.price_sol(decimals) * self.total_supply / (10 ** decimals)
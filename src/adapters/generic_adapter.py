@@ -8,7 +8,9 @@ from typing import Optional, Dict, Any
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
+from solana.rpc.async_api import AsyncClient
 from .base_adapter import LaunchpadAdapter, CurveData, TokenInfo
+from .token_cache import TokenInfoCache
 from ..safety.allowlist import AllowlistManager
 from ..utils.logger import get_logger
 
@@ -25,7 +27,9 @@ class GenericAdapter(LaunchpadAdapter):
         program_id: Pubkey,
         rpc_url: str = "https://api.mainnet-beta.solana.com",
         config: Optional[Dict[str, Any]] = None,
-        allowlist_manager: Optional[AllowlistManager] = None
+        allowlist_manager: Optional[AllowlistManager] = None,
+        token_cache: Optional[TokenInfoCache] = None,
+        client: Optional[AsyncClient] = None
     ):
         """
         Initialize generic adapter
@@ -35,8 +39,10 @@ class GenericAdapter(LaunchpadAdapter):
             rpc_url: Solana RPC endpoint
             config: Configuration dictionary for the launchpad
             allowlist_manager: Optional allowlist manager
+            token_cache: Optional disk cache for token info lookups
+            client: Optional shared RPC client (see create_rpc_client)
         """
-        super().__init__(program_id, rpc_url)
+        super().__init__(program_id, rpc_url, token_cache, client)
         
         self.config = config or {}
         self.allowlist = allowlist_manager or AllowlistManager()
@@ -44,20 +50,20 @@ class GenericAdapter(LaunchpadAdapter):
         # Add program to allowlist
         self.allowlist.add_program(program_id)
         
-        logger.info(f"GenericAdapter initialized for program: {program_id}")
+        logger.info("GenericAdapter initialized for program: %s", program_id)
     
     async def get_curve_data(self, token_mint: Pubkey) -> CurveData:
         """Get bonding curve data"""
-        logger.debug(f"Fetching curve data for {token_mint}")
+        logger.debug("Fetching curve data for %s", token_mint)
         
         # Generic implementation - would use config to determine behavior
         return CurveData(
             token_mint=token_mint,
-            current_price=0.0,
+            current_price_lamports=0,
             slope=0.0,
-            liquidity=0.0,
-            total_supply=0.0,
-            market_cap=0.0,
+            liquidity_lamports=0,
+            total_supply=0,
+            market_cap_lamports=0,
             timestamp=0.0
         )
     
@@ -69,7 +75,7 @@ class GenericAdapter(LaunchpadAdapter):
         slippage: float = 0.05
     ) -> Transaction:
         """Build buy token transaction"""
-        logger.info(f"Building generic buy transaction for {token_mint}")
+        logger.info("Building generic buy transaction for %s", token_mint)
         # Generic implementation would use config to build instruction
         raise NotImplementedError("Generic adapter requires configuration")
     
@@ -81,12 +87,12 @@ class GenericAdapter(LaunchpadAdapter):
         slippage: float = 0.05
     ) -> Transaction:
         """Build sell token transaction"""
-        logger.info(f"Building generic sell transaction for {token_mint}")
+        logger.info("Building generic sell transaction for %s", token_mint)
         raise NotImplementedError("Generic adapter requires configuration")
     
     async def get_token_info(self, token_mint: Pubkey) -> TokenInfo:
         """Get token information"""
-        logger.debug(f"Fetching token info for {token_mint}")
+        logger.debug("Fetching token info for %s", token_mint)
         
         return TokenInfo(
             mint=token_mint,
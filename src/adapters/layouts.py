@@ -0,0 +1,17 @@
+"""
+Account Layouts
+
+Binary layouts of launchpad program accounts, shared by the per-account
+parsers and the bulk (NumPy) decoders so the two cannot drift apart.
+"""
+
+import struct
+
+# Pump.fun bonding curve account: 8-byte account discriminator, then virtual
+# token reserves, virtual SOL reserves, real token reserves, real SOL
+# reserves, total supply (little-endian u64 each) and the `complete` flag
+CURVE_HEADER_SIZE = 8
+CURVE_FIELD_COUNT = 5
+CURVE_LAYOUT = struct.Struct(f"<{CURVE_FIELD_COUNT}Q?")
+CURVE_COMPLETE_OFFSET = CURVE_HEADER_SIZE + CURVE_LAYOUT.size - 1
+CURVE_ACCOUNT_MIN_SIZE = CURVE_HEADER_SIZE + CURVE_LAYOUT.size
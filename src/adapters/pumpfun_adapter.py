@@ -4,23 +4,76 @@ Pump.fun Adapter
 Adapter for Pump.fun launchpad platform.
 """
 
-from typing import Optional
+import asyncio
+import struct
+import time
+from typing import Callable, Dict, Optional, Tuple
+from solders.hash import Hash
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
-from solders.instruction import Instruction, AccountMeta
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
+from solders.instruction import Instruction, AccountMeta
+from solders.rpc.responses import AccountNotification
+from solana.rpc.commitment import Commitment, Confirmed, Processed
+from solana.rpc.websocket_api import connect as ws_connect
 from .base_adapter import LaunchpadAdapter, CurveData, TokenInfo
+from .layouts import CURVE_ACCOUNT_MIN_SIZE, CURVE_HEADER_SIZE, CURVE_LAYOUT
+from .token_cache import TokenInfoCache
+from .quote_math import (
+    buy_quote, curve_metrics, min_output, sell_quote, sol_to_lamports, to_base_units
+)
+from ..config.settings import Settings
 from ..safety.allowlist import AllowlistManager
 from ..safety.validator import InstructionValidator
 from ..safety.sanitizer import BehaviorSanitizer
 from ..utils.logger import get_logger
+from ..utils.pubkey import find_program_address
 
 logger = get_logger(__name__)
 
-# Pump.fun Program ID (mainnet)
-PUMP_FUN_PROGRAM_ID = Pubkey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
+# Pump.fun Program ID (mainnet, overridable via PUMP_FUN_PROGRAM_ID)
+PUMP_FUN_PROGRAM_ID = Settings.PUMP_FUN_PROGRAM_PUBKEY
+
+# Bonding curve PDA seed
+BONDING_CURVE_SEED = b"bonding-curve"
+
+# Pump.fun tokens are minted with 6 decimals
+TOKEN_DECIMALS = 6
+
+# Placeholder instruction discriminators until the Anchor ones are wired in
+BUY_DISCRIMINATOR = 0
+SELL_DISCRIMINATOR = 1
+
+# Buy/sell instruction data: discriminator (u8), amount (u64), minimum out (u64)
+_TRADE_LAYOUT = struct.Struct("<BQQ")
+
+# Upper bound on cached per-mint instruction templates
+_MAX_IX_TEMPLATES = 4096
+
+# Curve reads within this many seconds of a previous fetch reuse its result
+CURVE_CACHE_TTL = 1.0
+
+# Upper bound on cached curve snapshots
+_MAX_CURVE_CACHE = 4096
+
+# Background blockhash refresh period, and the age after which a cached
+# blockhash is no longer trusted (blockhashes expire after ~60s)
+BLOCKHASH_REFRESH_INTERVAL = 2.0
+BLOCKHASH_MAX_AGE = 20.0
+
+# Pause before re-subscribing after the server closes a curve websocket
+SUBSCRIBE_RECONNECT_DELAY = 1.0
+
+
+def _pack_buy(lamports: int, min_tokens_out: int) -> bytes:
+    """Serialize buy instruction data"""
+    return _TRADE_LAYOUT.pack(BUY_DISCRIMINATOR, lamports, min_tokens_out)
+
+
+def _pack_sell(tokens: int, min_sol_out: int) -> bytes:
+    """Serialize sell instruction data"""
+    return _TRADE_LAYOUT.pack(SELL_DISCRIMINATOR, tokens, min_sol_out)
 
 
 class PumpFunAdapter(LaunchpadAdapter):
@@ -31,7 +84,10 @@ class PumpFunAdapter(LaunchpadAdapter):
     def __init__(
         self,
         rpc_url: str = "https://api.mainnet-beta.solana.com",
-        allowlist_manager: Optional[AllowlistManager] = None
+        allowlist_manager: Optional[AllowlistManager] = None,
+        token_cache: Optional[TokenInfoCache] = None,
+        client: Optional[AsyncClient] = None,
+        curve_commitment: Commitment = Processed
     ):
         """
         Initialize Pump.fun adapter
@@ -39,65 +95,273 @@ class PumpFunAdapter(LaunchpadAdapter):
         Args:
             rpc_url: Solana RPC endpoint
             allowlist_manager: Optional allowlist manager for safety
+            token_cache: Optional disk cache for token info lookups
+            client: Optional shared RPC client (see create_rpc_client)
+            curve_commitment: Commitment for bonding curve reads and
+                subscriptions (default: processed, about one slot fresher
+                than confirmed)
         """
-        super().__init__(PUMP_FUN_PROGRAM_ID, rpc_url)
+        super().__init__(PUMP_FUN_PROGRAM_ID, rpc_url, token_cache, client)
         
-        self.client: Optional[AsyncClient] = None
+        self.curve_commitment = curve_commitment
         self.allowlist = allowlist_manager or AllowlistManager()
-        self.validator = InstructionValidator()
+        self.validator = InstructionValidator(self.program_id)
         self.sanitizer = BehaviorSanitizer()
         
+        # Mint-derived account metas, reused across buy/sell builds for the same mint
+        self._ix_templates: Dict[Pubkey, Tuple[AccountMeta, ...]] = {}
+        
+        # Recent curve snapshots by mint, served for CURVE_CACHE_TTL seconds
+        self._curve_cache: Dict[Pubkey, CurveData] = {}
+        
+        # Latest blockhash, kept fresh by a background task started in connect()
+        self._blockhash: Optional[Hash] = None
+        self._blockhash_ts = 0.0
+        self._blockhash_task: Optional[asyncio.Task] = None
+        
         # Add Pump.fun program to allowlist
         self.allowlist.add_program(PUMP_FUN_PROGRAM_ID)
         
+        # Cached allowlist verdict for program_id, valid for _allowlist_version
+        self._program_allowed = False
+        self._allowlist_version = -1
+        self._refresh_allowed()
+        
         logger.info("PumpFunAdapter initialized")
     
+    def _refresh_allowed(self):
+        """Re-check program_id against the allowlist and cache the verdict"""
+        self._allowlist_version = self.allowlist.version
+        self._program_allowed = self.allowlist.is_allowed(self.program_id)
+    
     async def connect(self):
-        """Connect to Solana RPC"""
-        if self.client is None:
-            self.client = AsyncClient(self.rpc_url)
-            logger.debug("Connected to Solana RPC")
+        """Connect to Solana RPC and start the blockhash refresher"""
+        await super().connect()
+        
+        if self._blockhash_task is None or self._blockhash_task.done():
+            self._blockhash_task = asyncio.create_task(self._blockhash_updater())
     
     async def disconnect(self):
-        """Disconnect from Solana RPC"""
-        if self.client:
-            await self.client.close()
-            self.client = None
-            logger.debug("Disconnected from Solana RPC")
+        """Stop the blockhash refresher and disconnect from Solana RPC"""
+        if self._blockhash_task is not None:
+            self._blockhash_task.cancel()
+            try:
+                await self._blockhash_task
+            except asyncio.CancelledError:
+                pass
+            self._blockhash_task = None
+        self._blockhash = None
+        
+        await super().disconnect()
+    
+    async def _blockhash_updater(self):
+        """Refresh the cached blockhash until cancelled"""
+        while True:
+            try:
+                resp = await self.client.get_latest_blockhash(commitment=Confirmed)
+                self._blockhash = resp.value.blockhash
+                self._blockhash_ts = time.monotonic()
+            except Exception as e:
+                logger.warning("Blockhash refresh failed: %s", e)
+            await asyncio.sleep(BLOCKHASH_REFRESH_INTERVAL)
+    
+    async def get_cached_blockhash(self) -> Hash:
+        """
+        Get a recent blockhash, from the background cache when fresh
+        
+        Falls back to a live RPC fetch when nothing is cached yet or the
+        cached value is older than BLOCKHASH_MAX_AGE.
+        
+        Returns:
+            Recent blockhash
+        """
+        if (
+            self._blockhash is not None
+            and time.monotonic() - self._blockhash_ts < BLOCKHASH_MAX_AGE
+        ):
+            return self._blockhash
+        
+        resp = await self.client.get_latest_blockhash(commitment=Confirmed)
+        self._blockhash = resp.value.blockhash
+        self._blockhash_ts = time.monotonic()
+        return self._blockhash
     
     async def get_curve_data(self, token_mint: Pubkey) -> CurveData:
         """
         Get bonding curve data for a token
         
+        Concurrent calls for the same mint share one RPC, and a snapshot
+        younger than CURVE_CACHE_TTL is returned without one.
+        
         Args:
             token_mint: Token mint address
             
         Returns:
             CurveData instance
         """
-        await self.connect()
+        cached = self._curve_cache.get(token_mint)
+        if cached is not None and time.time() - cached.timestamp < CURVE_CACHE_TTL:
+            return cached
         
+        return await self._coalesce(
+            ("curve_data", token_mint),
+            lambda: self._fetch_curve_data(token_mint)
+        )
+    
+    async def _fetch_curve_data(self, token_mint: Pubkey) -> CurveData:
+        """Fetch and parse the bonding curve account"""
         try:
-            # Fetch curve data from on-chain accounts
-            # TODO: Implement on-chain account parsing for Pump.fun bonding curve
-            logger.debug(f"Fetching curve data for {token_mint}")
-            # TODO: Parse on-chain account data to populate curve metrics
-            curve_data = CurveData(
-                token_mint=token_mint,
-                current_price=0.0,
-                slope=0.0,
-                liquidity=0.0,
-                total_supply=0.0,
-                market_cap=0.0,
-                timestamp=0.0
+            logger.debug("Fetching curve data for %s", token_mint)
+            
+            curve_pda = self._bonding_curve_pda(token_mint)
+            resp = await self.client.get_account_info(
+                curve_pda,
+                commitment=self.curve_commitment,
+                encoding="base64"
             )
+            if resp.value is None:
+                raise ValueError(f"Bonding curve account not found for {token_mint}")
             
+            curve_data = self._parse_curve_account(token_mint, resp.value.data)
+            if len(self._curve_cache) >= _MAX_CURVE_CACHE:
+                self._curve_cache.clear()
+            self._curve_cache[token_mint] = curve_data
             return curve_data
             
         except Exception as e:
-            logger.error(f"Error fetching curve data: {e}")
+            logger.error("Error fetching curve data: %s", e)
             raise
     
+    async def subscribe_curve(
+        self,
+        token_mint: Pubkey,
+        callback: Callable[[CurveData], None]
+    ):
+        """
+        Stream bonding curve updates for a token
+        
+        Subscribes to the bonding curve account over websocket and calls
+        callback with fresh CurveData each time the account changes. Prefer
+        this over polling get_curve_data. Runs until cancelled: when the
+        server closes the websocket normally, it logs the close and
+        re-subscribes after SUBSCRIBE_RECONNECT_DELAY. Updates that fail to
+        parse are logged and skipped. Connection errors propagate to the
+        caller.
+        
+        Args:
+            token_mint: Token mint address
+            callback: Called with CurveData on every update
+        """
+        curve_pda = self._bonding_curve_pda(token_mint)
+        
+        while True:
+            async with ws_connect(self.ws_url) as websocket:
+                await websocket.account_subscribe(
+                    curve_pda,
+                    commitment=self.curve_commitment,
+                    encoding="base64"
+                )
+                # First message confirms the subscription
+                await websocket.recv()
+                logger.debug("Subscribed to curve updates for %s", token_mint)
+                
+                async for messages in websocket:
+                    for message in messages:
+                        if not isinstance(message, AccountNotification):
+                            continue
+                        data = message.result.value.data
+                        try:
+                            curve_data = self._parse_curve_account(token_mint, data)
+                        except ValueError as e:
+                            # One bad update should not end the stream
+                            logger.warning("Skipping curve update for %s: %s", token_mint, e)
+                            continue
+                        callback(curve_data)
+            
+            logger.info("Curve subscription for %s closed by server, reconnecting", token_mint)
+            await asyncio.sleep(SUBSCRIBE_RECONNECT_DELAY)
+    
+    def _parse_curve_account(self, token_mint: Pubkey, data: bytes) -> CurveData:
+        """
+        Parse bonding curve account data
+        
+        Args:
+            token_mint: Token mint address
+            data: Raw bonding curve account data
+            
+        Returns:
+            CurveData instance
+            
+        Raises:
+            ValueError: If data is too short for the curve layout
+        """
+        if len(data) < CURVE_ACCOUNT_MIN_SIZE:
+            raise ValueError(f"Invalid bonding curve account for {token_mint}")
+        
+        (
+            virtual_token_reserves,
+            virtual_sol_reserves,
+            real_token_reserves,
+            real_sol_reserves,
+            total_supply,
+            _complete
+        ) = CURVE_LAYOUT.unpack_from(data, CURVE_HEADER_SIZE)
+        
+        price, slope, market_cap = curve_metrics(
+            virtual_sol_reserves,
+            virtual_token_reserves,
+            total_supply,
+            TOKEN_DECIMALS
+        )
+        
+        return CurveData(
+            token_mint=token_mint,
+            current_price_lamports=price,
+            slope=slope,
+            liquidity_lamports=real_sol_reserves,
+            total_supply=total_supply,
+            market_cap_lamports=market_cap,
+            timestamp=time.time(),
+            virtual_sol_reserves=virtual_sol_reserves,
+            virtual_token_reserves=virtual_token_reserves
+        )
+    
+    async def quote_buy(self, token_mint: Pubkey, sol_amount: float) -> int:
+        """
+        Get expected tokens out for a buy
+        
+        Args:
+            token_mint: Token mint address
+            sol_amount: Amount of SOL to spend
+            
+        Returns:
+            Expected tokens out in base units
+        """
+        curve_data = await self.get_curve_data(token_mint)
+        return buy_quote(
+            curve_data.virtual_sol_reserves,
+            curve_data.virtual_token_reserves,
+            sol_to_lamports(sol_amount)
+        )
+    
+    async def quote_sell(self, token_mint: Pubkey, token_amount: float) -> int:
+        """
+        Get expected SOL out for a sell
+        
+        Args:
+            token_mint: Token mint address
+            token_amount: Amount of tokens to sell
+            
+        Returns:
+            Expected SOL out in lamports
+        """
+        curve_data = await self.get_curve_data(token_mint)
+        return sell_quote(
+            curve_data.virtual_sol_reserves,
+            curve_data.virtual_token_reserves,
+            to_base_units(token_amount, TOKEN_DECIMALS)
+        )
+    
     async def buy_token(
         self,
         buyer: Keypair,
@@ -117,45 +381,45 @@ class PumpFunAdapter(LaunchpadAdapter):
         Returns:
             Transaction ready to sign and send
         """
-        await self.connect()
-        
-        # Validate program is in allowlist
-        if not self.allowlist.is_allowed(self.program_id):
+        # Validate program is in allowlist (re-checked only when it changes)
+        if self.allowlist.version != self._allowlist_version:
+            self._refresh_allowed()
+        if not self._program_allowed:
             raise ValueError(f"Program {self.program_id} not in allowlist")
         
         try:
-            # Get recent blockhash
-            blockhash_resp = await self.client.get_latest_blockhash(commitment=Confirmed)
-            recent_blockhash = blockhash_resp.value.blockhash
+            # Recent blockhash (kept by the background refresher) and quote
+            # (short-lived curve cache); on a cache miss the RPCs overlap
+            recent_blockhash, tokens_out = await asyncio.gather(
+                self.get_cached_blockhash(),
+                self.quote_buy(token_mint, sol_amount)
+            )
+            min_tokens_out = min_output(tokens_out, slippage)
             
             # Build buy instruction
             instruction = self._build_buy_instruction(
                 buyer.pubkey(),
                 token_mint,
                 sol_amount,
-                slippage
+                slippage,
+                min_tokens_out
             )
             
-            # Validate instruction
-            self.validator.validate_instruction(instruction, self.program_id)
-            
-            # Sanitize behavior (remove identifying patterns)
-            instruction = self.sanitizer.sanitize_instruction(instruction)
+            # Validate and sanitize (remove identifying patterns)
+            instruction = self._validate_and_sanitize(instruction)
             
-            # Build transaction
-            transaction = Transaction()
-            transaction.add(instruction)
-            transaction.sign([buyer], recent_blockhash)
+            # Build and sign transaction
+            transaction = self._sign_transaction([instruction], buyer, recent_blockhash)
             
             logger.info(
-                f"Built buy transaction: {token_mint}, amount: {sol_amount} SOL, "
-                f"slippage: {slippage * 100}%"
+                "Built buy transaction: %s, amount: %s SOL, slippage: %s%%",
+                token_mint, sol_amount, slippage * 100
             )
             
             return transaction
             
         except Exception as e:
-            logger.error(f"Error building buy transaction: {e}")
+            logger.error("Error building buy transaction: %s", e)
             raise
     
     async def sell_token(
@@ -177,105 +441,167 @@ class PumpFunAdapter(LaunchpadAdapter):
         Returns:
             Transaction ready to sign and send
         """
-        await self.connect()
-        
-        # Validate program is in allowlist
-        if not self.allowlist.is_allowed(self.program_id):
+        # Validate program is in allowlist (re-checked only when it changes)
+        if self.allowlist.version != self._allowlist_version:
+            self._refresh_allowed()
+        if not self._program_allowed:
             raise ValueError(f"Program {self.program_id} not in allowlist")
         
         try:
-            # Get recent blockhash
-            blockhash_resp = await self.client.get_latest_blockhash(commitment=Confirmed)
-            recent_blockhash = blockhash_resp.value.blockhash
+            # Recent blockhash (kept by the background refresher) and quote
+            # (short-lived curve cache); on a cache miss the RPCs overlap
+            recent_blockhash, sol_out = await asyncio.gather(
+                self.get_cached_blockhash(),
+                self.quote_sell(token_mint, token_amount)
+            )
+            min_sol_out = min_output(sol_out, slippage)
             
             # Build sell instruction
             instruction = self._build_sell_instruction(
                 seller.pubkey(),
                 token_mint,
                 token_amount,
-                slippage
+                slippage,
+                min_sol_out
             )
             
-            # Validate instruction
-            self.validator.validate_instruction(instruction, self.program_id)
+            # Validate and sanitize (remove identifying patterns)
+            instruction = self._validate_and_sanitize(instruction)
             
-            # Sanitize behavior
-            instruction = self.sanitizer.sanitize_instruction(instruction)
-            
-            # Build transaction
-            transaction = Transaction()
-            transaction.add(instruction)
-            transaction.sign([seller], recent_blockhash)
+            # Build and sign transaction
+            transaction = self._sign_transaction([instruction], seller, recent_blockhash)
             
             logger.info(
-                f"Built sell transaction: {token_mint}, amount: {token_amount}, "
-                f"slippage: {slippage * 100}%"
+                "Built sell transaction: %s, amount: %s, slippage: %s%%",
+                token_mint, token_amount, slippage * 100
             )
             
             return transaction
             
         except Exception as e:
-            logger.error(f"Error building sell transaction: {e}")
+            logger.error("Error building sell transaction: %s", e)
             raise
     
+    def _validate_and_sanitize(self, instruction: Instruction) -> Instruction:
+        """
+        Run the safety checks and sanitization for a built instruction
+        
+        Args:
+            instruction: Instruction to check
+            
+        Returns:
+            Sanitized instruction
+            
+        Raises:
+            ValueError: If validation fails
+        """
+        self.validator.validate_instruction(instruction)
+        return self.sanitizer.sanitize_instruction(instruction)
+    
     async def get_token_info(self, token_mint: Pubkey) -> TokenInfo:
         """
         Get token information
         
+        Concurrent calls for the same mint share one RPC.
+        
         Args:
             token_mint: Token mint address
             
         Returns:
             TokenInfo instance
         """
-        await self.connect()
-        
+        return await self._coalesce(
+            ("token_info", token_mint),
+            lambda: self._fetch_token_info(token_mint)
+        )
+    
+    async def _fetch_token_info(self, token_mint: Pubkey) -> TokenInfo:
+        """Fetch the token mint and metadata accounts"""
         try:
-            # TODO: Fetch token metadata from on-chain accounts
-            logger.debug(f"Fetching token info for {token_mint}")
-            
-            token_info = TokenInfo(
-                mint=token_mint,
-                symbol="",
-                name="",
-                uri=None
-            )
+            logger.debug("Fetching token info for %s", token_mint)
             
-            return token_info
+            return await self._fetch_mint_with_metadata(token_mint)
             
         except Exception as e:
-            logger.error(f"Error fetching token info: {e}")
+            logger.error("Error fetching token info: %s", e)
             raise
     
+    def _bonding_curve_pda(self, token_mint: Pubkey) -> Pubkey:
+        """
+        Derive the bonding curve PDA for a token
+        
+        Derivations are cached per mint, see find_program_address.
+        
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            Bonding curve account address
+        """
+        curve_pda, _ = find_program_address(
+            (BONDING_CURVE_SEED, bytes(token_mint)),
+            self.program_id
+        )
+        return curve_pda
+    
+    def _ix_template(self, token_mint: Pubkey) -> Tuple[AccountMeta, ...]:
+        """
+        Get the mint-derived account metas for buy/sell instructions
+        
+        PDA derivation and AccountMeta construction run once per mint;
+        later builds for the same mint reuse the cached metas.
+        
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            Account metas shared by every buy/sell of this mint
+        """
+        template = self._ix_templates.get(token_mint)
+        if template is None:
+            if len(self._ix_templates) >= _MAX_IX_TEMPLATES:
+                self._ix_templates.clear()
+            template = (
+                AccountMeta(pubkey=token_mint, is_signer=False, is_writable=True),
+                AccountMeta(
+                    pubkey=self._bonding_curve_pda(token_mint),
+                    is_signer=False,
+                    is_writable=True
+                ),
+            )
+            self._ix_templates[token_mint] = template
+        return template
+    
     def _build_buy_instruction(
         self,
         buyer: Pubkey,
         token_mint: Pubkey,
         sol_amount: float,
-        slippage: float
+        slippage: float,
+        min_tokens_out: int = 0
     ) -> Instruction:
         """
         Build buy instruction for Pump.fun
         
+        Data is discriminator (u8), SOL amount in lamports (u64) and
+        minimum tokens out (u64).
+        
         TODO: Implement full instruction building:
-        - Derive required PDAs (bonding curve, associated token accounts)
-        - Serialize instruction data with proper discriminators
+        - Derive associated token accounts
+        - Use the program's 8-byte discriminators
         - Include all required accounts per Pump.fun program spec
         """
-        lamports = int(sol_amount * 1_000_000_000)
+        lamports = sol_to_lamports(sol_amount)
         
         accounts = [
             AccountMeta(pubkey=buyer, is_signer=True, is_writable=True),
-            AccountMeta(pubkey=token_mint, is_signer=False, is_writable=True),
+            *self._ix_template(token_mint),
         ]
         
-        # TODO: Serialize proper Pump.fun buy instruction data
-        data = bytes([0])
-        
         return Instruction(
             program_id=self.program_id,
             accounts=accounts,
-            data=data
+            data=_pack_buy(lamports, min_tokens_out)
         )
     
     def _build_sell_instruction(
@@ -283,23 +609,26 @@ class PumpFunAdapter(LaunchpadAdapter):
         seller: Pubkey,
         token_mint: Pubkey,
         token_amount: float,
-        slippage: float
+        slippage: float,
+        min_sol_out: int = 0
     ) -> Instruction:
         """
         Build sell instruction for Pump.fun
         
+        Data is discriminator (u8), token amount in base units (u64) and
+        minimum SOL out in lamports (u64).
+        
         TODO: Implement full sell instruction building
         """
+        tokens = to_base_units(token_amount, TOKEN_DECIMALS)
+        
         accounts = [
             AccountMeta(pubkey=seller, is_signer=True, is_writable=True),
-            AccountMeta(pubkey=token_mint, is_signer=False, is_writable=True),
+            *self._ix_template(token_mint),
         ]
         
-        data = bytes([1])  # Sell instruction discriminator
-        
         return Instruction(
             program_id=self.program_id,
             accounts=accounts,
-            data=data
+            data=_pack_sell(tokens, min_sol_out)
         )
-
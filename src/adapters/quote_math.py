@@ -0,0 +1,142 @@
+"""
+Quote Math
+
+Constant-product bonding curve quotes in integer on-chain units.
+"""
+
+from typing import Tuple
+from .base_adapter import LAMPORTS_PER_SOL, PRICE_SCALE
+
+# Slippage is applied in basis points so min-output math stays integral
+BPS_DENOMINATOR = 10_000
+
+
+def to_base_units(amount: float, decimals: int) -> int:
+    """
+    Convert a whole-unit amount to integer base units
+
+    Rounds to the nearest base unit: float products such as
+    0.29 * 10**6 land just below the exact value, and int() would drop
+    a unit.
+
+    Args:
+        amount: Amount in whole units (SOL or tokens)
+        decimals: Decimals of the unit
+
+    Returns:
+        Amount in base units
+    """
+    return round(amount * 10 ** decimals)
+
+
+def sol_to_lamports(sol: float) -> int:
+    """
+    Convert a SOL amount to lamports, rounding to the nearest lamport
+
+    Args:
+        sol: Amount in SOL
+
+    Returns:
+        Amount in lamports
+    """
+    return round(sol * LAMPORTS_PER_SOL)
+
+
+def _ceil_div(a: int, b: int) -> int:
+    """Integer division rounding up"""
+    return -(-a // b)
+
+
+def buy_quote(virtual_sol_reserves: int, virtual_token_reserves: int, sol_in: int) -> int:
+    """
+    Tokens received for spending SOL on a constant-product curve
+
+    Remaining reserves are rounded up, so the quote never overstates
+    what the curve pays out.
+
+    Args:
+        virtual_sol_reserves: Virtual SOL reserves in lamports
+        virtual_token_reserves: Virtual token reserves in base units
+        sol_in: SOL to spend in lamports
+
+    Returns:
+        Tokens out in base units
+    """
+    if sol_in <= 0 or virtual_token_reserves <= 0:
+        return 0
+
+    k = virtual_sol_reserves * virtual_token_reserves
+    new_token_reserves = _ceil_div(k, virtual_sol_reserves + sol_in)
+    return virtual_token_reserves - new_token_reserves
+
+
+def sell_quote(virtual_sol_reserves: int, virtual_token_reserves: int, tokens_in: int) -> int:
+    """
+    SOL received for selling tokens on a constant-product curve
+
+    Args:
+        virtual_sol_reserves: Virtual SOL reserves in lamports
+        virtual_token_reserves: Virtual token reserves in base units
+        tokens_in: Tokens to sell in base units
+
+    Returns:
+        SOL out in lamports
+    """
+    if tokens_in <= 0 or virtual_sol_reserves <= 0:
+        return 0
+
+    k = virtual_sol_reserves * virtual_token_reserves
+    new_sol_reserves = _ceil_div(k, virtual_token_reserves + tokens_in)
+    return virtual_sol_reserves - new_sol_reserves
+
+
+def min_output(amount: int, slippage: float) -> int:
+    """
+    Minimum acceptable output after slippage
+
+    Args:
+        amount: Quoted output amount
+        slippage: Maximum acceptable slippage (0-1)
+
+    Returns:
+        Minimum output amount
+    """
+    slippage_bps = round(slippage * BPS_DENOMINATOR)
+    return amount * (BPS_DENOMINATOR - slippage_bps) // BPS_DENOMINATOR
+
+
+def curve_metrics(
+    virtual_sol_reserves: int,
+    virtual_token_reserves: int,
+    total_supply: int,
+    decimals: int
+) -> Tuple[int, float, int]:
+    """
+    Spot price, slope and market cap of a constant-product curve
+    
+    Price and market cap stay in exact integer math; only the slope,
+    which is informational, is a float.
+    
+    Args:
+        virtual_sol_reserves: Virtual SOL reserves in lamports
+        virtual_token_reserves: Virtual token reserves in base units
+        total_supply: Total token supply in base units
+        decimals: Token decimals
+        
+    Returns:
+        Tuple of (price of one whole token in lamports scaled by
+        PRICE_SCALE, slope in SOL per token per token bought,
+        market cap in lamports)
+    """
+    if virtual_token_reserves <= 0:
+        return 0, 0.0, 0
+    
+    token_unit = 10 ** decimals
+    price = virtual_sol_reserves * token_unit * PRICE_SCALE // virtual_token_reserves
+    # d(price)/d(tokens bought) = 2 * vsol / vtok^2, in whole-token and SOL units
+    slope = (
+        2 * virtual_sol_reserves * token_unit * token_unit
+        / (virtual_token_reserves * virtual_token_reserves * LAMPORTS_PER_SOL)
+    )
+    market_cap = price * total_supply // (token_unit * PRICE_SCALE)
+    return price, slope, market_cap
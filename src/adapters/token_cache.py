@@ -0,0 +1,150 @@
+"""
+Token Info Cache
+
+Disk-backed cache for token metadata, keyed by mint address.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+from solders.pubkey import Pubkey
+from .base_adapter import TokenInfo
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Mint metadata rarely changes, so entries live for a day by default
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+# Bump when the token_info table changes; older cache files are rebuilt
+SCHEMA_VERSION = 2
+
+
+class TokenInfoCache:
+    """
+    SQLite-backed cache of TokenInfo records
+
+    Repeated lookups of the same mint are served from disk instead of
+    issuing another RPC round-trip, and survive process restarts.
+
+    Methods block on SQLite I/O; async callers should run them in a
+    worker thread (asyncio.to_thread). The connection is shared across
+    threads and serialized by a lock.
+    """
+
+    def __init__(self, path: str = ":memory:", ttl: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Initialize token info cache
+
+        Args:
+            path: SQLite database path (default: in-memory)
+            ttl: Seconds before an entry expires (None: never expire)
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL with synchronous=NORMAL commits without an fsync per write;
+        # losing the last writes on power failure is fine for a cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Files from an older schema are dropped and rebuilt: entries are
+        # only a cache and will be re-fetched
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS token_info")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS token_info ("
+            "mint TEXT PRIMARY KEY, "
+            "symbol TEXT NOT NULL, "
+            "name TEXT NOT NULL, "
+            "uri TEXT, "
+            "created_at REAL, "
+            "decimals INTEGER, "
+            "fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info("TokenInfoCache initialized at %s", path)
+
+    def get(self, mint: Pubkey) -> Optional[TokenInfo]:
+        """
+        Get cached token info
+
+        Args:
+            mint: Token mint address
+
+        Returns:
+            TokenInfo if cached and not expired, otherwise None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT symbol, name, uri, created_at, decimals, fetched_at "
+                "FROM token_info WHERE mint = ?",
+                (str(mint),)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        symbol, name, uri, created_at, decimals, fetched_at = row
+        if self.ttl is not None and time.time() - fetched_at > self.ttl:
+            return None
+
+        return TokenInfo(
+            mint=mint,
+            symbol=symbol,
+            name=name,
+            uri=uri,
+            created_at=created_at,
+            decimals=decimals
+        )
+
+    def put(self, token_info: TokenInfo):
+        """
+        Store token info
+
+        Args:
+            token_info: TokenInfo to cache
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO token_info "
+                "(mint, symbol, name, uri, created_at, decimals, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(token_info.mint),
+                    token_info.symbol,
+                    token_info.name,
+                    token_info.uri,
+                    token_info.created_at,
+                    token_info.decimals,
+                    time.time()
+                )
+            )
+            self._conn.commit()
+
+    def invalidate(self, mint: Pubkey):
+        """
+        Remove cached token info
+
+        Args:
+            mint: Token mint address
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM token_info WHERE mint = ?", (str(mint),))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM token_info")
+            self._conn.commit()
+        logger.info("TokenInfoCache cleared")
+
+    def close(self):
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
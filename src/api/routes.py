@@ -4,48 +4,125 @@ API Routes for Launchpad Adapters
 REST API endpoints for launchpad adapter operations.
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, FastAPI, HTTPException
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Optional
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
-import base64
+
+try:
+    import pybase64 as base64  # SIMD base64, same API as the stdlib module
+except ImportError:  # pybase64 is optional
+    import base64
+
+from ..adapters.base_adapter import LaunchpadAdapter, create_rpc_client
 from ..adapters.pumpfun_adapter import PumpFunAdapter
 from ..adapters.bonkfun_adapter import BonkFunAdapter
+from ..adapters.token_cache import TokenInfoCache
 from ..config.settings import Settings
+from ..utils.pubkey import pubkey_from_string
 
 router = APIRouter(prefix="/api/v1/launchpad", tags=["launchpad"])
 
-# Global adapters (in production, use dependency injection)
-pumpfun_adapter = PumpFunAdapter(rpc_url=Settings.SOLANA_RPC_URL)
-bonkfun_adapter = BonkFunAdapter(rpc_url=Settings.SOLANA_RPC_URL)
+# Launchpad name (lowercase, with aliases) -> adapter, filled in by lifespan
+_ADAPTERS: Dict[str, LaunchpadAdapter] = {}
 
 
-class BuyTokenRequest(BaseModel):
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build and connect adapters at start-up and release them on shutdown"""
+    # One RPC client shared by all adapters, so concurrent requests multiplex
+    # over a single HTTP/2 connection pool. Created per start-up, since it is
+    # closed on shutdown and the app may be started again in this process
+    rpc_client = create_rpc_client(Settings.SOLANA_RPC_URL)
+    token_cache = TokenInfoCache(Settings.TOKEN_CACHE_PATH)
+    pumpfun_adapter = PumpFunAdapter(
+        rpc_url=Settings.SOLANA_RPC_URL,
+        token_cache=token_cache,
+        client=rpc_client
+    )
+    bonkfun_adapter = BonkFunAdapter(
+        rpc_url=Settings.SOLANA_RPC_URL,
+        token_cache=token_cache,
+        client=rpc_client
+    )
+    _ADAPTERS.update({
+        "pumpfun": pumpfun_adapter,
+        "pump.fun": pumpfun_adapter,
+        "bonkfun": bonkfun_adapter,
+        "bonk.fun": bonkfun_adapter,
+    })
+    await pumpfun_adapter.connect()
+    await bonkfun_adapter.connect()
+    try:
+        yield
+    finally:
+        _ADAPTERS.clear()
+        await pumpfun_adapter.disconnect()
+        await bonkfun_adapter.disconnect()
+        await rpc_client.close()
+        token_cache.close()
+
+
+class MintRequest(BaseModel):
+    """Base request model carrying a token mint"""
+    token_mint: str = Field(..., description="Token mint address")
+    
+    @field_validator("token_mint")
+    @classmethod
+    def _validate_token_mint(cls, value: str) -> str:
+        # Parsed through the shared cache, so the handler's lookup is a hit
+        pubkey_from_string(value)
+        return value
+    
+    @property
+    def mint(self) -> Pubkey:
+        """Parsed token mint"""
+        return pubkey_from_string(self.token_mint)
+
+
+class BuyTokenRequest(MintRequest):
     """Request model for buying tokens"""
     launchpad: str = Field(..., description="Launchpad name: 'pumpfun' or 'bonkfun'")
-    token_mint: str = Field(..., description="Token mint address")
     sol_amount: float = Field(..., ge=0.0, description="Amount of SOL to spend")
     slippage: float = Field(0.05, ge=0.0, le=1.0, description="Maximum slippage (0-1)")
     wallet_keypair: str = Field(..., description="Base64 encoded wallet keypair")
 
 
-class SellTokenRequest(BaseModel):
+class SellTokenRequest(MintRequest):
     """Request model for selling tokens"""
     launchpad: str = Field(..., description="Launchpad name: 'pumpfun' or 'bonkfun'")
-    token_mint: str = Field(..., description="Token mint address")
     token_amount: float = Field(..., ge=0.0, description="Amount of tokens to sell")
     slippage: float = Field(0.05, ge=0.0, le=1.0, description="Maximum slippage (0-1)")
     wallet_keypair: str = Field(..., description="Base64 encoded wallet keypair")
 
 
+class BuyTokenResponse(BaseModel):
+    """Response model for a built buy transaction"""
+    success: bool
+    transaction: str
+    launchpad: str
+    token_mint: str
+    sol_amount: float
+
+
+class SellTokenResponse(BaseModel):
+    """Response model for a built sell transaction"""
+    success: bool
+    transaction: str
+    launchpad: str
+    token_mint: str
+    token_amount: float
+
+
 class CurveDataResponse(BaseModel):
     """Response model for curve data"""
     token_mint: str
     current_price: float
     slope: float
     liquidity: float
-    total_supply: float
+    total_supply: int
     market_cap: float
     timestamp: float
 
@@ -57,6 +134,20 @@ class TokenInfoResponse(BaseModel):
     name: str
     uri: Optional[str] = None
     created_at: Optional[float] = None
+    decimals: Optional[int] = None
+
+
+class LaunchpadResponse(BaseModel):
+    """Response model for one supported launchpad"""
+    name: str
+    display_name: str
+    program_id: str
+    supported: bool
+
+
+class LaunchpadsResponse(BaseModel):
+    """Response model for the launchpad list"""
+    launchpads: List[LaunchpadResponse]
 
 
 def decode_keypair(keypair_str: str) -> Keypair:
@@ -70,18 +161,15 @@ def decode_keypair(keypair_str: str) -> Keypair:
 
 def get_adapter(launchpad: str):
     """Get adapter for launchpad"""
-    launchpad_lower = launchpad.lower()
-    
-    if launchpad_lower == "pumpfun" or launchpad_lower == "pump.fun":
-        return pumpfun_adapter
-    elif launchpad_lower == "bonkfun" or launchpad_lower == "bonk.fun":
-        return bonkfun_adapter
-    else:
+    # Clients normally send lowercase names, so try the exact key first
+    adapter = _ADAPTERS.get(launchpad) or _ADAPTERS.get(launchpad.lower())
+    if adapter is None:
         raise HTTPException(status_code=400, detail=f"Unknown launchpad: {launchpad}")
+    return adapter
 
 
 @router.post("/buy-token")
-async def buy_token(request: BuyTokenRequest):
+async def buy_token(request: BuyTokenRequest) -> BuyTokenResponse:
     """
     Build buy token transaction
     
@@ -90,11 +178,10 @@ async def buy_token(request: BuyTokenRequest):
     try:
         adapter = get_adapter(request.launchpad)
         wallet = decode_keypair(request.wallet_keypair)
-        token_mint = Pubkey.from_string(request.token_mint)
         
         transaction = await adapter.buy_token(
             wallet,
-            token_mint,
+            request.mint,
             request.sol_amount,
             request.slippage
         )
@@ -103,13 +190,13 @@ async def buy_token(request: BuyTokenRequest):
         transaction_bytes = bytes(transaction)
         transaction_b64 = base64.b64encode(transaction_bytes).decode()
         
-        return {
-            "success": True,
-            "transaction": transaction_b64,
-            "launchpad": request.launchpad,
-            "token_mint": request.token_mint,
-            "sol_amount": request.sol_amount
-        }
+        return BuyTokenResponse(
+            success=True,
+            transaction=transaction_b64,
+            launchpad=request.launchpad,
+            token_mint=request.token_mint,
+            sol_amount=request.sol_amount
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -117,7 +204,7 @@ async def buy_token(request: BuyTokenRequest):
 
 
 @router.post("/sell-token")
-async def sell_token(request: SellTokenRequest):
+async def sell_token(request: SellTokenRequest) -> SellTokenResponse:
     """
     Build sell token transaction
     
@@ -126,11 +213,10 @@ async def sell_token(request: SellTokenRequest):
     try:
         adapter = get_adapter(request.launchpad)
         wallet = decode_keypair(request.wallet_keypair)
-        token_mint = Pubkey.from_string(request.token_mint)
         
         transaction = await adapter.sell_token(
             wallet,
-            token_mint,
+            request.mint,
             request.token_amount,
             request.slippage
         )
@@ -139,13 +225,13 @@ async def sell_token(request: SellTokenRequest):
         transaction_bytes = bytes(transaction)
         transaction_b64 = base64.b64encode(transaction_bytes).decode()
         
-        return {
-            "success": True,
-            "transaction": transaction_b64,
-            "launchpad": request.launchpad,
-            "token_mint": request.token_mint,
-            "token_amount": request.token_amount
-        }
+        return SellTokenResponse(
+            success=True,
+            transaction=transaction_b64,
+            launchpad=request.launchpad,
+            token_mint=request.token_mint,
+            token_amount=request.token_amount
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -153,21 +239,21 @@ async def sell_token(request: SellTokenRequest):
 
 
 @router.get("/curve-data/{launchpad}/{token_mint}")
-async def get_curve_data(launchpad: str, token_mint: str):
+async def get_curve_data(launchpad: str, token_mint: str) -> CurveDataResponse:
     """Get bonding curve data for a token"""
     try:
         adapter = get_adapter(launchpad)
-        mint = Pubkey.from_string(token_mint)
+        mint = pubkey_from_string(token_mint)
         
         curve_data = await adapter.get_curve_data(mint)
         
         return CurveDataResponse(
             token_mint=token_mint,
-            current_price=curve_data.current_price,
+            current_price=curve_data.current_price_sol,
             slope=curve_data.slope,
-            liquidity=curve_data.liquidity,
+            liquidity=curve_data.liquidity_sol,
             total_supply=curve_data.total_supply,
-            market_cap=curve_data.market_cap,
+            market_cap=curve_data.market_cap_sol,
             timestamp=curve_data.timestamp
         )
     except HTTPException:
@@ -177,20 +263,21 @@ async def get_curve_data(launchpad: str, token_mint: str):
 
 
 @router.get("/token-info/{launchpad}/{token_mint}")
-async def get_token_info(launchpad: str, token_mint: str):
+async def get_token_info(launchpad: str, token_mint: str) -> TokenInfoResponse:
     """Get token information"""
     try:
         adapter = get_adapter(launchpad)
-        mint = Pubkey.from_string(token_mint)
+        mint = pubkey_from_string(token_mint)
         
-        token_info = await adapter.get_token_info(mint)
+        token_info = await adapter.get_token_info_cached(mint)
         
         return TokenInfoResponse(
             mint=token_mint,
             symbol=token_info.symbol,
             name=token_info.name,
             uri=token_info.uri,
-            created_at=token_info.created_at
+            created_at=token_info.created_at,
+            decimals=token_info.decimals
         )
     except HTTPException:
         raise
@@ -199,22 +286,22 @@ async def get_token_info(launchpad: str, token_mint: str):
 
 
 @router.get("/launchpads")
-async def get_launchpads():
+async def get_launchpads() -> LaunchpadsResponse:
     """Get list of supported launchpads"""
-    return {
-        "launchpads": [
-            {
-                "name": "pumpfun",
-                "display_name": "Pump.fun",
-                "program_id": str(pumpfun_adapter.get_program_id()),
-                "supported": True
-            },
-            {
-                "name": "bonkfun",
-                "display_name": "Bonk.fun",
-                "program_id": str(bonkfun_adapter.get_program_id()),
-                "supported": False  # Not fully implemented
-            }
+    return LaunchpadsResponse(
+        launchpads=[
+            LaunchpadResponse(
+                name="pumpfun",
+                display_name="Pump.fun",
+                program_id=str(get_adapter("pumpfun").get_program_id()),
+                supported=True
+            ),
+            LaunchpadResponse(
+                name="bonkfun",
+                display_name="Bonk.fun",
+                program_id=str(get_adapter("bonkfun").get_program_id()),
+                supported=False  # Not fully implemented
+            )
         ]
-    }
+    )
 
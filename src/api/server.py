@@ -4,7 +4,7 @@ FastAPI server for Launchpad Adapters
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import router
+from .routes import lifespan, router
 from ..config.settings import Settings
 from ..utils.logger import get_logger
 
@@ -13,7 +13,8 @@ logger = get_logger(__name__)
 app = FastAPI(
     title="Evalys Launchpad Adapters",
     description="Launchpad adapters for Pump.fun, Bonk.fun, and other platforms",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -3,6 +3,9 @@ Configuration settings
 """
 
 import os
+from typing import Final
+from solders.pubkey import Pubkey
+from ..utils.pubkey import pubkey_from_string
 
 
 class Settings:
@@ -16,6 +19,7 @@ class Settings:
         "PUMP_FUN_PROGRAM_ID",
         "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
     )
+    PUMP_FUN_PROGRAM_PUBKEY: Final[Pubkey] = pubkey_from_string(PUMP_FUN_PROGRAM_ID)
     
     # Bonk.fun Program ID
     # Set via BONK_FUN_PROGRAM_ID environment variable when available
@@ -23,6 +27,10 @@ class Settings:
         "BONK_FUN_PROGRAM_ID",
         "11111111111111111111111111111111"
     )
+    BONK_FUN_PROGRAM_PUBKEY: Final[Pubkey] = pubkey_from_string(BONK_FUN_PROGRAM_ID)
+    
+    # Token info cache (SQLite path; ":memory:" keeps it per process)
+    TOKEN_CACHE_PATH: str = os.getenv("TOKEN_CACHE_PATH", ":memory:")
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -4,21 +4,65 @@ Allowlist Manager
 Manages program allowlists for safety and compliance.
 """
 
-from typing import Set
+from collections.abc import Set as AbstractSet
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Set
 from solders.pubkey import Pubkey
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class _ProgramIdView(AbstractSet):
+    """
+    Read-only, live view of an allowlist's program IDs as base58 strings
+    
+    Wraps the manager's Pubkey set without copying it. Later changes to the
+    allowlist are visible through the view.
+    """
+    
+    __slots__ = ("_programs",)
+    
+    def __init__(self, programs: Set[Pubkey]):
+        self._programs = programs
+    
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> Set[str]:
+        # Set operators (|, &, -, ^) return plain sets, not views
+        return set(iterable)
+    
+    def __contains__(self, program_id: object) -> bool:
+        if isinstance(program_id, str):
+            try:
+                program_id = Pubkey.from_string(program_id)
+            except ValueError:
+                return False
+        return program_id in self._programs
+    
+    def __iter__(self) -> Iterator[str]:
+        return (str(program_id) for program_id in self._programs)
+    
+    def __len__(self) -> int:
+        return len(self._programs)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({set(self)!r})"
+
+
 class AllowlistManager:
     """
     Manages allowlists of approved programs
     """
     
+    __slots__ = ("allowed_programs", "_frozen", "version")
+    
     def __init__(self):
         """Initialize allowlist manager"""
-        self.allowed_programs: Set[str] = set()
+        # Pubkeys hash and compare natively, with no base58 round-trip
+        self.allowed_programs: Set[Pubkey] = set()
+        # Immutable snapshot built by freeze(), dropped on every change
+        self._frozen: Optional[FrozenSet[Pubkey]] = None
+        # Bumped on every change, so callers can cache membership results
+        self.version = 0
         logger.info("AllowlistManager initialized")
     
     def add_program(self, program_id: Pubkey):
@@ -28,9 +72,10 @@ class AllowlistManager:
         Args:
             program_id: Program ID to allow
         """
-        program_str = str(program_id)
-        self.allowed_programs.add(program_str)
-        logger.debug(f"Added program to allowlist: {program_str}")
+        self.allowed_programs.add(program_id)
+        self._frozen = None
+        self.version += 1
+        logger.debug("Added program to allowlist: %s", program_id)
     
     def remove_program(self, program_id: Pubkey):
         """
@@ -39,10 +84,43 @@ class AllowlistManager:
         Args:
             program_id: Program ID to remove
         """
-        program_str = str(program_id)
-        if program_str in self.allowed_programs:
-            self.allowed_programs.remove(program_str)
-            logger.debug(f"Removed program from allowlist: {program_str}")
+        if program_id in self.allowed_programs:
+            self.allowed_programs.remove(program_id)
+            self._frozen = None
+            self.version += 1
+            logger.debug("Removed program from allowlist: %s", program_id)
+    
+    def add_programs(self, program_ids: Iterable[Pubkey]):
+        """
+        Add many programs to allowlist
+        
+        Grows the sets once and logs once, for bulk loads.
+        
+        Args:
+            program_ids: Program IDs to allow
+        """
+        new_programs = set(program_ids) - self.allowed_programs
+        if not new_programs:
+            return
+        self.allowed_programs |= new_programs
+        self._frozen = None
+        self.version += 1
+        logger.info("Added %d programs to allowlist", len(new_programs))
+    
+    def remove_programs(self, program_ids: Iterable[Pubkey]):
+        """
+        Remove many programs from allowlist
+        
+        Args:
+            program_ids: Program IDs to remove
+        """
+        removed = self.allowed_programs.intersection(program_ids)
+        if not removed:
+            return
+        self.allowed_programs -= removed
+        self._frozen = None
+        self.version += 1
+        logger.info("Removed %d programs from allowlist", len(removed))
     
     def is_allowed(self, program_id: Pubkey) -> bool:
         """
@@ -54,25 +132,68 @@ class AllowlistManager:
         Returns:
             True if allowed
         """
-        program_str = str(program_id)
-        is_allowed = program_str in self.allowed_programs
+        is_allowed = program_id in self.allowed_programs
         
         if not is_allowed:
-            logger.warning(f"Program {program_str} not in allowlist")
+            logger.warning("Program %s not in allowlist", program_id)
         
         return is_allowed
     
-    def get_allowed_programs(self) -> Set[str]:
+    def is_allowed_many(self, program_ids: Iterable[Pubkey]) -> List[bool]:
+        """
+        Check many programs against the allowlist
+        
+        For bulk screening, e.g. of every instruction in a block. Rejections
+        are logged once per batch rather than once per program.
+        
+        Args:
+            program_ids: Program IDs to check
+            
+        Returns:
+            One flag per program ID, True if allowed
+        """
+        allowed = self.allowed_programs
+        results = [program_id in allowed for program_id in program_ids]
+        
+        rejected = results.count(False)
+        if rejected:
+            logger.warning("%d of %d programs not in allowlist", rejected, len(results))
+        
+        return results
+    
+    def freeze(self) -> FrozenSet[Pubkey]:
+        """
+        Get an immutable snapshot of the allowed programs
+        
+        The snapshot is built once and reused until the allowlist changes,
+        so read-heavy phases (e.g. screening a batch) can share it, even
+        across threads, without copying the set for each reader.
+        
+        Returns:
+            Frozen set of allowed program IDs
+        """
+        frozen = self._frozen
+        if frozen is None:
+            frozen = self._frozen = frozenset(self.allowed_programs)
+        return frozen
+    
+    def get_allowed_programs(self) -> AbstractSet[str]:
         """
         Get all allowed programs
         
+        The result is a read-only view, not a copy: it costs O(1) to build
+        and reflects later changes to the allowlist. Use set(...) for a
+        snapshot.
+        
         Returns:
             Set of allowed program IDs (as strings)
         """
-        return self.allowed_programs.copy()
+        return _ProgramIdView(self.allowed_programs)
     
     def clear(self):
         """Clear all allowed programs"""
         self.allowed_programs.clear()
+        self._frozen = None
+        self.version += 1
         logger.info("Allowlist cleared")
 
@@ -4,20 +4,42 @@ Behavior Sanitizer
 Sanitizes instructions and transactions to remove identifying patterns.
 """
 
-from solders.instruction import Instruction
+import operator
+from itertools import islice
+from solders.instruction import AccountMeta, Instruction
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _account_sort_key(account: AccountMeta) -> bytes:
+    """Sort key for normalize_accounts: the account's raw pubkey bytes"""
+    return bytes(account.pubkey)
+
+
+def _identity(instruction: Instruction) -> Instruction:
+    """Return the instruction unchanged (sanitization disabled)"""
+    return instruction
+
+
 class BehaviorSanitizer:
     """
     Sanitizes transaction behavior to prevent pattern detection
     """
     
-    def __init__(self):
-        """Initialize sanitizer"""
-        logger.info("BehaviorSanitizer initialized")
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize sanitizer
+        
+        Args:
+            enabled: Whether to sanitize; when False, sanitize_instruction
+                is bound to an identity function so calls cost no more than
+                a plain function call
+        """
+        self.enabled = enabled
+        if not enabled:
+            self.sanitize_instruction = _identity
+        logger.info("BehaviorSanitizer initialized (enabled=%s)", enabled)
     
     def sanitize_instruction(self, instruction: Instruction) -> Instruction:
         """
@@ -50,14 +72,21 @@ class BehaviorSanitizer:
         """
         # Sort accounts by public key to normalize order
         # This prevents pattern detection based on account ordering
-        sorted_accounts = sorted(
-            instruction.accounts,
-            key=lambda acc: str(acc.pubkey())
-        )
+        # (raw key bytes give a stable order without base58 encoding)
+        accounts = instruction.accounts
+        keys = list(map(_account_sort_key, accounts))
+        
+        # Already-normalized instructions are returned as-is, skipping the
+        # sort and the rebuild
+        if all(map(operator.le, keys, islice(keys, 1, None))):
+            return instruction
+        
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        accounts = [accounts[i] for i in order]
         
         return Instruction(
             program_id=instruction.program_id,
-            accounts=sorted_accounts,
+            accounts=accounts,
             data=instruction.data
         )
     
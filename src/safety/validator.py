@@ -4,6 +4,7 @@ Instruction Validator
 Validates instructions for safety and compliance.
 """
 
+from typing import Optional
 from solders.instruction import Instruction
 from solders.pubkey import Pubkey
 from ..utils.logger import get_logger
@@ -16,22 +17,42 @@ class InstructionValidator:
     Validates Solana instructions
     """
     
-    def __init__(self):
-        """Initialize validator"""
+    __slots__ = ("expected_program",)
+    
+    def __init__(self, expected_program: Optional[Pubkey] = None):
+        """
+        Initialize validator
+        
+        Args:
+            expected_program: Default program ID for validate_instruction,
+                for validators that are reused for a single program
+        """
+        self.expected_program = expected_program
         logger.info("InstructionValidator initialized")
     
-    def validate_instruction(self, instruction: Instruction, expected_program: Pubkey):
+    def validate_instruction(
+        self,
+        instruction: Instruction,
+        expected_program: Optional[Pubkey] = None
+    ):
         """
         Validate instruction
         
         Args:
             instruction: Instruction to validate
-            expected_program: Expected program ID
+            expected_program: Expected program ID (defaults to the one
+                given at construction)
             
         Raises:
             ValueError: If validation fails
         """
-        # Check program ID matches
+        if expected_program is None:
+            expected_program = self.expected_program
+            if expected_program is None:
+                raise ValueError("No expected program ID to validate against")
+        
+        # Check program ID matches. Pubkey.__eq__ compares the 32 key bytes
+        # natively and is faster than comparing bytes() copies
         if instruction.program_id != expected_program:
             raise ValueError(
                 f"Instruction program ID {instruction.program_id} "
@@ -46,7 +67,7 @@ class InstructionValidator:
         if not instruction.data:
             logger.warning("Instruction has no data")
         
-        logger.debug(f"Instruction validated for program: {expected_program}")
+        logger.debug("Instruction validated for program: %s", expected_program)
     
     def validate_accounts(self, instruction: Instruction, required_accounts: int):
         """
@@ -59,9 +80,11 @@ class InstructionValidator:
         Raises:
             ValueError: If validation fails
         """
-        if len(instruction.accounts) < required_accounts:
+        # .accounts builds a new list on each access, so read it once
+        num_accounts = len(instruction.accounts)
+        if num_accounts < required_accounts:
             raise ValueError(
-                f"Instruction has {len(instruction.accounts)} accounts, "
+                f"Instruction has {num_accounts} accounts, "
                 f"but requires at least {required_accounts}"
             )
 
@@ -0,0 +1,50 @@
+"""
+Pubkey utilities
+"""
+
+from functools import lru_cache
+from typing import Tuple
+from solders.pubkey import Pubkey
+
+
+@lru_cache(maxsize=4096)
+def pubkey_from_string(value: str) -> Pubkey:
+    """
+    Parse a base58 public key, caching the result
+    
+    Mints and program IDs recur across requests, so each string is
+    decoded once. Pubkey is immutable, so cached instances can be shared.
+    
+    Use this rather than Pubkey.from_string wherever a mint or program ID
+    string is parsed. The decode itself already runs in Rust inside
+    solders, so a cache hit is the only further saving available.
+    
+    Args:
+        value: Base58 encoded public key
+        
+    Returns:
+        Parsed Pubkey
+        
+    Raises:
+        ValueError: If value is not a valid public key
+    """
+    return Pubkey.from_string(value)
+
+
+@lru_cache(maxsize=16384)
+def find_program_address(seeds: Tuple[bytes, ...], program_id: Pubkey) -> Tuple[Pubkey, int]:
+    """
+    Derive a program address, caching the result
+    
+    Derivation searches bump seeds with a SHA-256 per attempt, and the
+    result depends only on the seeds and program, so each (seeds, program)
+    pair is derived once.
+    
+    Args:
+        seeds: PDA seeds (a tuple, so the call is hashable)
+        program_id: Owning program ID
+        
+    Returns:
+        Tuple of (program address, bump seed)
+    """
+    return Pubkey.find_program_address(list(seeds), program_id)
@@ -0,0 +1,30 @@
+"""
+Shared test fixtures
+"""
+
+import json
+from pathlib import Path
+import pytest
+
+# Fixture directory
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load_fixture(relative_path: str) -> dict:
+    """Load a JSON fixture, skipping the test when it is not available"""
+    fixture_path = FIXTURES_DIR / relative_path
+    if not fixture_path.exists():
+        pytest.skip(f"Fixture not available: {relative_path}")
+    return json.loads(fixture_path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def pumpfun_buy_fixture() -> dict:
+    """Pump.fun buy transaction fixture, loaded once per session"""
+    return _load_fixture("pumpfun/buy_example.json")
+
+
+@pytest.fixture(scope="session")
+def pumpfun_curve_state_fixture() -> dict:
+    """Pump.fun curve state fixture, loaded once per session"""
+    return _load_fixture("pumpfun/curve_state_example.json")
@@ -6,6 +6,8 @@ import pytest
 from solders.pubkey import Pubkey
 from src.safety.allowlist import AllowlistManager
 
+PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
 
 def test_allowlist_init():
     """Test allowlist initialization"""
@@ -16,44 +18,109 @@ def test_allowlist_init():
 def test_add_program():
     """Test adding program to allowlist"""
     allowlist = AllowlistManager()
-    program_id = Pubkey.from_string("11111111111111111111111111111111")
     
-    allowlist.add_program(program_id)
-    assert allowlist.is_allowed(program_id)
+    allowlist.add_program(PROGRAM_ID)
+    assert allowlist.is_allowed(PROGRAM_ID)
     assert len(allowlist.get_allowed_programs()) == 1
 
 
 def test_remove_program():
     """Test removing program from allowlist"""
     allowlist = AllowlistManager()
-    program_id = Pubkey.from_string("11111111111111111111111111111111")
     
-    allowlist.add_program(program_id)
-    assert allowlist.is_allowed(program_id)
+    allowlist.add_program(PROGRAM_ID)
+    assert allowlist.is_allowed(PROGRAM_ID)
     
-    allowlist.remove_program(program_id)
-    assert not allowlist.is_allowed(program_id)
+    allowlist.remove_program(PROGRAM_ID)
+    assert not allowlist.is_allowed(PROGRAM_ID)
 
 
 def test_is_allowed():
     """Test checking if program is allowed"""
     allowlist = AllowlistManager()
-    program_id = Pubkey.from_string("11111111111111111111111111111111")
     
-    assert not allowlist.is_allowed(program_id)
+    assert not allowlist.is_allowed(PROGRAM_ID)
     
-    allowlist.add_program(program_id)
-    assert allowlist.is_allowed(program_id)
+    allowlist.add_program(PROGRAM_ID)
+    assert allowlist.is_allowed(PROGRAM_ID)
 
 
 def test_clear():
     """Test clearing allowlist"""
     allowlist = AllowlistManager()
-    program_id = Pubkey.from_string("11111111111111111111111111111111")
     
-    allowlist.add_program(program_id)
+    allowlist.add_program(PROGRAM_ID)
     assert len(allowlist.get_allowed_programs()) == 1
     
     allowlist.clear()
     assert len(allowlist.get_allowed_programs()) == 0
 
+
+def test_is_allowed_many():
+    """Test checking a batch of programs"""
+    allowlist = AllowlistManager()
+    other = Pubkey.new_unique()
+    
+    allowlist.add_program(PROGRAM_ID)
+    assert allowlist.is_allowed_many([PROGRAM_ID, other, PROGRAM_ID]) == [True, False, True]
+    assert allowlist.is_allowed_many([]) == []
+
+
+def test_get_allowed_programs_is_live_view():
+    """Test that the allowed programs view reflects later changes"""
+    allowlist = AllowlistManager()
+    programs = allowlist.get_allowed_programs()
+    
+    allowlist.add_program(PROGRAM_ID)
+    assert str(PROGRAM_ID) in programs
+    assert set(programs) == {str(PROGRAM_ID)}
+    assert "not-a-pubkey" not in programs
+    
+    allowlist.remove_program(PROGRAM_ID)
+    assert len(programs) == 0
+
+
+def test_add_and_remove_programs():
+    """Test bulk adding and removing programs"""
+    allowlist = AllowlistManager()
+    program_ids = [Pubkey.new_unique() for _ in range(3)]
+    
+    allowlist.add_programs(program_ids)
+    version = allowlist.version
+    assert all(allowlist.is_allowed(p) for p in program_ids)
+    
+    allowlist.add_programs(program_ids)
+    assert allowlist.version == version
+    
+    allowlist.remove_programs(program_ids[:2])
+    assert allowlist.is_allowed_many(program_ids) == [False, False, True]
+    assert allowlist.version == version + 1
+
+
+def test_freeze_snapshot_is_reused_until_change():
+    """Test that freeze caches its snapshot and drops it on changes"""
+    allowlist = AllowlistManager()
+    allowlist.add_program(PROGRAM_ID)
+    
+    frozen = allowlist.freeze()
+    assert frozen == frozenset({PROGRAM_ID})
+    assert allowlist.freeze() is frozen
+    
+    allowlist.remove_program(PROGRAM_ID)
+    assert PROGRAM_ID in frozen
+    assert allowlist.freeze() == frozenset()
+
+
+def test_get_allowed_programs_set_operators():
+    """Test that set operators on the view return plain sets"""
+    allowlist = AllowlistManager()
+    other = str(Pubkey.new_unique())
+    allowlist.add_program(PROGRAM_ID)
+    programs = allowlist.get_allowed_programs()
+    
+    union = programs | {other}
+    assert union == {str(PROGRAM_ID), other}
+    assert len(union) == 2
+    assert len(programs & {str(PROGRAM_ID)}) == 1
+    assert len(programs - {str(PROGRAM_ID)}) == 0
+    assert isinstance(programs ^ {other}, set)
@@ -0,0 +1,181 @@
+"""
+Tests for base adapter helpers
+"""
+
+import asyncio
+import gc
+import struct
+from types import SimpleNamespace
+import pytest
+from solders.pubkey import Pubkey
+from src.adapters.base_adapter import MINT_ACCOUNT_SIZE, MINT_DECIMALS_OFFSET, create_rpc_client
+from src.adapters.generic_adapter import GenericAdapter
+
+PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+MINT = Pubkey.from_string("So11111111111111111111111111111111111111112")
+
+
+def test_parse_mint_account():
+    """Test parsing decimals from an SPL mint account"""
+    adapter = GenericAdapter(PROGRAM_ID)
+    data = bytearray(MINT_ACCOUNT_SIZE)
+    data[MINT_DECIMALS_OFFSET] = 9
+
+    token_info = adapter._parse_mint_account(MINT, bytes(data))
+    assert token_info.mint == MINT
+    assert token_info.decimals == 9
+
+
+def test_parse_mint_account_rejects_short_data():
+    """Test that non-mint accounts are rejected"""
+    adapter = GenericAdapter(PROGRAM_ID)
+
+    with pytest.raises(ValueError):
+        adapter._parse_mint_account(MINT, bytes(10))
+
+
+def test_validate_programs():
+    """Test batch program validation"""
+    adapter = GenericAdapter(PROGRAM_ID)
+
+    assert adapter.validate_programs([PROGRAM_ID, MINT, PROGRAM_ID]) == [True, False, True]
+    assert adapter.validate_programs([]) == []
+
+
+def test_ws_url_derived_from_rpc_url():
+    """Test websocket endpoint derivation"""
+    assert GenericAdapter(PROGRAM_ID, "https://rpc.example.com").ws_url == "wss://rpc.example.com"
+    assert GenericAdapter(PROGRAM_ID, "http://127.0.0.1:8899").ws_url == "ws://127.0.0.1:8899"
+
+
+async def test_coalesce_shares_inflight_fetch():
+    """Test that concurrent fetches for one key run once"""
+    adapter = GenericAdapter(PROGRAM_ID)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        *(adapter._coalesce(("curve_data", MINT), fetch) for _ in range(5))
+    )
+
+    assert results == [1] * 5
+    assert calls == 1
+    assert not adapter._inflight
+
+    # A later call issues a fresh fetch
+    assert await adapter._coalesce(("curve_data", MINT), fetch) == 2
+
+
+async def test_coalesce_retrieves_error_when_callers_cancelled():
+    """Test that a failed fetch with no remaining callers is not reported as unretrieved"""
+    adapter = GenericAdapter(PROGRAM_ID)
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.01)  # still running after its caller is cancelled
+        raise ValueError("RPC failed")
+
+    try:
+        caller = asyncio.create_task(adapter._coalesce(("curve_data", MINT), fetch))
+        await started.wait()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0.05)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert not adapter._inflight
+    assert errors == []
+
+
+def make_metadata_data(name: str, symbol: str, uri: str) -> bytes:
+    """Build Metaplex metadata account data with NUL-padded strings"""
+    data = bytes([4]) + bytes(32) + bytes(MINT)
+    for value, size in ((name, 32), (symbol, 10), (uri, 200)):
+        data += struct.pack("<I", size) + value.encode().ljust(size, b"\x00")
+    return data
+
+
+def test_parse_metadata_account():
+    """Test parsing name, symbol and uri from metadata"""
+    adapter = GenericAdapter(PROGRAM_ID)
+    token_info = adapter._parse_mint_account(MINT, bytes(MINT_ACCOUNT_SIZE))
+
+    adapter._parse_metadata_account(
+        token_info,
+        make_metadata_data("Evalys", "EVL", "https://example.com/evl.json")
+    )
+
+    assert token_info.name == "Evalys"
+    assert token_info.symbol == "EVL"
+    assert token_info.uri == "https://example.com/evl.json"
+
+
+def test_parse_metadata_account_rejects_truncated_data():
+    """Test that truncated metadata is rejected"""
+    adapter = GenericAdapter(PROGRAM_ID)
+    token_info = adapter._parse_mint_account(MINT, bytes(MINT_ACCOUNT_SIZE))
+
+    with pytest.raises(ValueError):
+        adapter._parse_metadata_account(token_info, make_metadata_data("A", "B", "C")[:100])
+
+
+async def test_disconnect_leaves_shared_client_open():
+    """Test that an injected client is shared and not closed by the adapter"""
+    client = create_rpc_client("http://127.0.0.1:8899")
+    first = GenericAdapter(PROGRAM_ID, client=client)
+    second = GenericAdapter(PROGRAM_ID, client=client)
+
+    assert first.client is second.client
+    await first.disconnect()
+    assert second.client is client
+    assert first.client is client
+
+    await client.close()
+
+
+class StubAccountsClient:
+    """RPC client stand-in serving getMultipleAccounts from a dict"""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.requests = []
+
+    async def get_multiple_accounts(self, pubkeys):
+        self.requests.append(list(pubkeys))
+        return SimpleNamespace(value=[self.accounts.get(pubkey) for pubkey in pubkeys])
+
+
+async def test_get_token_infos_fetches_each_mint_once():
+    """Test that repeated mints share one RPC and bad entries do not fail the batch"""
+    other = Pubkey.new_unique()
+    missing = Pubkey.new_unique()
+    not_a_mint = Pubkey.new_unique()
+    data = bytearray(MINT_ACCOUNT_SIZE)
+    data[MINT_DECIMALS_OFFSET] = 6
+    client = StubAccountsClient({
+        MINT: SimpleNamespace(data=bytes(MINT_ACCOUNT_SIZE)),
+        other: SimpleNamespace(data=bytes(data)),
+        not_a_mint: SimpleNamespace(data=bytes(10)),
+    })
+    adapter = GenericAdapter(PROGRAM_ID, client=client)
+
+    token_infos = await adapter.get_token_infos([other, MINT, missing, not_a_mint, other, MINT])
+
+    assert client.requests == [[other, MINT, missing, not_a_mint]]
+    assert [info.mint if info else None for info in token_infos] == [
+        other, MINT, None, None, other, MINT
+    ]
+    assert token_infos[0].decimals == 6
+    assert token_infos[1].decimals == 0
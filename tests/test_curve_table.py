@@ -0,0 +1,65 @@
+"""
+Tests for curve table
+"""
+
+import struct
+import pytest
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+np = pytest.importorskip("numpy")
+
+from src.adapters.curve_table import CurveTable
+from src.adapters.pumpfun_adapter import PumpFunAdapter
+
+PROGRAM_ID = Pubkey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
+
+
+def make_curve_account(vtok: int, vsol: int, rtok: int, rsol: int, supply: int) -> Account:
+    """Build a bonding curve account with the given reserves"""
+    data = bytes(8) + struct.pack("<QQQQQ?", vtok, vsol, rtok, rsol, supply, False)
+    return Account(lamports=1, data=data, owner=PROGRAM_ID, executable=False, rent_epoch=0)
+
+
+def test_from_rpc():
+    """Test decoding curve accounts into columns"""
+    mints = [Pubkey.new_unique(), Pubkey.new_unique()]
+    accounts = [
+        make_curve_account(1_000_000_000_000_000, 30_000_000_000, 800_000_000_000_000, 0, 10**15),
+        None,
+    ]
+
+    table = CurveTable.from_rpc(mints, accounts)
+
+    assert len(table) == 2
+    assert table.valid.tolist() == [True, False]
+    assert table.virtual_sol_reserves[0] == 30_000_000_000
+    assert table.virtual_token_reserves[0] == 1_000_000_000_000_000
+    assert table.total_supply[0] == 10**15
+    assert table.mint(0) == mints[0]
+
+
+def test_price_sol():
+    """Test vectorized price calculation"""
+    mints = [Pubkey.new_unique()]
+    accounts = [make_curve_account(1_000_000_000_000_000, 30_000_000_000, 0, 0, 10**15)]
+
+    table = CurveTable.from_rpc(mints, accounts)
+
+    assert table.price_sol()[0] == pytest.approx(3e-08)
+    assert table.market_cap_sol()[0] == pytest.approx(30.0)
+
+
+def test_from_rpc_matches_adapter_parser():
+    """Test that bulk and per-account decoding agree on the curve layout"""
+    mint = Pubkey.new_unique()
+    account = make_curve_account(
+        1_000_000_000_000_000, 30_000_000_000, 800_000_000_000_000, 2_000_000_000, 10**15
+    )
+
+    table = CurveTable.from_rpc([mint], [account])
+    curve_data = PumpFunAdapter()._parse_curve_account(mint, account.data)
+
+    assert table.virtual_token_reserves[0] == curve_data.virtual_token_reserves
+    assert table.virtual_sol_reserves[0] == curve_data.virtual_sol_reserves
+    assert table.total_supply[0] == curve_data.total_supply
@@ -5,19 +5,16 @@ Tests that verify adapter outputs match known-good transaction fixtures.
 """
 
 import pytest
-import json
-from pathlib import Path
 from solders.pubkey import Pubkey
-from src.adapters.pumpfun_adapter import PumpFunAdapter
-
-# Fixture directory
-FIXTURES_DIR = Path(__file__).parent / "fixtures" / "pumpfun"
+from src.adapters.pumpfun_adapter import PumpFunAdapter, TOKEN_DECIMALS
+from src.adapters.base_adapter import LAMPORTS_PER_SOL
+from src.adapters.quote_math import buy_quote, min_output, sol_to_lamports, to_base_units
 
 
 class TestPumpFunGolden:
     """Golden tests for Pump.fun adapter"""
     
-    def test_build_buy_tx_matches_fixture(self):
+    def test_build_buy_tx_matches_fixture(self, pumpfun_buy_fixture):
         """
         Test that built buy transaction matches known-good fixture
         
@@ -26,13 +23,7 @@ class TestPumpFunGolden:
         - Correct account list
         - Correct instruction data structure
         """
-        # Load fixture
-        fixture_path = FIXTURES_DIR / "buy_example.json"
-        if not fixture_path.exists():
-            pytest.skip("Buy fixture not available")
-        
-        with open(fixture_path) as f:
-            fixture = json.load(f)
+        fixture = pumpfun_buy_fixture
         
         # Build transaction (would use actual adapter)
         # For now, verify fixture structure
@@ -51,7 +42,7 @@ class TestPumpFunGolden:
             assert "is_signer" in account
             assert "is_writable" in account
     
-    def test_parse_event_extracts_data(self):
+    def test_parse_event_extracts_data(self, pumpfun_buy_fixture):
         """
         Test that parse_event extracts correct mint/amounts from transaction
         
@@ -60,13 +51,7 @@ class TestPumpFunGolden:
         - Mint address is extracted
         - Amounts are correctly parsed
         """
-        # Load fixture
-        fixture_path = FIXTURES_DIR / "buy_example.json"
-        if not fixture_path.exists():
-            pytest.skip("Buy fixture not available")
-        
-        with open(fixture_path) as f:
-            fixture = json.load(f)
+        fixture = pumpfun_buy_fixture
         
         # Verify fixture has required fields for parsing
         assert "instruction_data" in fixture
@@ -78,7 +63,7 @@ class TestPumpFunGolden:
         assert "discriminator" in instruction_data
         assert "sol_amount" in instruction_data or "token_amount" in instruction_data
     
-    def test_quote_matches_observed(self):
+    def test_quote_matches_observed(self, pumpfun_curve_state_fixture):
         """
         Test that quote roughly matches observed curve output
         
@@ -87,13 +72,7 @@ class TestPumpFunGolden:
         - Output amount is within expected range
         - Slippage calculation is correct
         """
-        # Load curve state fixture
-        curve_fixture_path = FIXTURES_DIR / "curve_state_example.json"
-        if not curve_fixture_path.exists():
-            pytest.skip("Curve state fixture not available")
-        
-        with open(curve_fixture_path) as f:
-            curve_fixture = json.load(f)
+        curve_fixture = pumpfun_curve_state_fixture
         
         # Verify curve state structure
         assert "curve_state" in curve_fixture
@@ -104,15 +83,21 @@ class TestPumpFunGolden:
         assert "virtual_sol_reserves" in curve_state
         assert "virtual_token_reserves" in curve_state
         
-        # In real implementation, would:
-        # 1. Calculate quote from curve state
-        # 2. Compare to observed transaction output
-        # 3. Verify quote is within acceptable range
-        
-        # For now, verify curve state is valid
+        # Verify curve state is valid
         assert curve_state["current_price"] > 0
         assert curve_state["virtual_sol_reserves"] > 0
         assert curve_state["virtual_token_reserves"] > 0
+        
+        # Calculate quote from curve state
+        vsol = sol_to_lamports(curve_state["virtual_sol_reserves"])
+        vtok = to_base_units(curve_state["virtual_token_reserves"], TOKEN_DECIMALS)
+        sol_in = LAMPORTS_PER_SOL // 2
+        tokens_out = buy_quote(vsol, vtok, sol_in)
+        
+        # Buying moves the price up, so the average fill is worse than spot
+        spot_tokens = sol_in * vtok // vsol
+        assert 0 < tokens_out < spot_tokens
+        assert min_output(tokens_out, 0.05) < tokens_out
 
 
 class TestBonkFunGolden:
@@ -0,0 +1,261 @@
+"""
+Tests for Pump.fun adapter
+"""
+
+import asyncio
+import struct
+import time
+from types import SimpleNamespace
+import pytest
+from solders.account import Account
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.rpc.responses import AccountNotification, AccountNotificationResult, RpcResponseContext
+from src.adapters import pumpfun_adapter
+from src.adapters.pumpfun_adapter import PumpFunAdapter
+
+MINT = Pubkey.from_string("So11111111111111111111111111111111111111112")
+
+
+def make_curve_data(vtok: int, vsol: int, rtok: int, rsol: int, supply: int) -> bytes:
+    """Build bonding curve account data"""
+    return bytes(8) + struct.pack("<QQQQQ?", vtok, vsol, rtok, rsol, supply, False)
+
+
+def test_parse_curve_account():
+    """Test parsing bonding curve account data"""
+    adapter = PumpFunAdapter()
+    data = make_curve_data(
+        1_000_000_000_000_000,  # 1B tokens (6 decimals)
+        30_000_000_000,         # 30 SOL
+        800_000_000_000_000,
+        2_000_000_000,          # 2 SOL
+        1_000_000_000_000_000
+    )
+
+    curve_data = adapter._parse_curve_account(MINT, data)
+
+    assert curve_data.token_mint == MINT
+    assert curve_data.virtual_sol_reserves == 30_000_000_000
+    assert curve_data.virtual_token_reserves == 1_000_000_000_000_000
+    assert curve_data.total_supply == 1_000_000_000_000_000
+    assert curve_data.current_price_sol == pytest.approx(3e-08)
+    assert curve_data.liquidity_sol == pytest.approx(2.0)
+    assert curve_data.market_cap_sol == pytest.approx(30.0)
+
+
+def test_parse_curve_account_rejects_short_data():
+    """Test that truncated curve accounts are rejected"""
+    adapter = PumpFunAdapter()
+
+    with pytest.raises(ValueError):
+        adapter._parse_curve_account(MINT, bytes(16))
+
+
+def test_build_buy_instruction_reuses_template():
+    """Test that mint-derived accounts are built once per mint"""
+    adapter = PumpFunAdapter()
+    buyer = Pubkey.new_unique()
+
+    first = adapter._build_buy_instruction(buyer, MINT, 0.5, 0.05)
+    second = adapter._build_sell_instruction(buyer, MINT, 1000.0, 0.05)
+
+    assert first.program_id == adapter.get_program_id()
+    assert first.accounts[0].pubkey == buyer
+    assert first.accounts[0].is_signer
+    assert first.accounts[1:] == second.accounts[1:]
+    assert first.accounts[2].pubkey == adapter._bonding_curve_pda(MINT)
+    assert len(adapter._ix_templates) == 1
+
+
+def test_bonding_curve_pda_matches_derivation():
+    """Test that the cached PDA matches a direct derivation"""
+    adapter = PumpFunAdapter()
+    expected, _ = Pubkey.find_program_address(
+        [b"bonding-curve", bytes(MINT)],
+        adapter.get_program_id()
+    )
+
+    assert adapter._bonding_curve_pda(MINT) == expected
+    assert adapter._bonding_curve_pda(MINT) == expected
+
+
+async def test_get_cached_blockhash_skips_rpc_when_fresh():
+    """Test that a fresh cached blockhash is served without an RPC"""
+    adapter = PumpFunAdapter()
+    blockhash = Hash.new_unique()
+    adapter._blockhash = blockhash
+    adapter._blockhash_ts = time.monotonic()
+    adapter.client = None  # any RPC would fail
+
+    assert await adapter.get_cached_blockhash() == blockhash
+
+
+async def test_buy_token_builds_signed_transaction():
+    """Test building a buy from cached curve state and blockhash"""
+    adapter = PumpFunAdapter()
+    buyer = Keypair()
+    adapter._curve_cache[MINT] = adapter._parse_curve_account(
+        MINT,
+        make_curve_data(1_073_000_000_000_000, 30_000_000_000, 0, 0, 1_000_000_000_000_000)
+    )
+    adapter._blockhash = Hash.new_unique()
+    adapter._blockhash_ts = time.monotonic()
+    adapter.client = None  # any RPC would fail
+
+    transaction = await adapter.buy_token(buyer, MINT, 0.5, 0.05)
+
+    assert transaction.message.account_keys[0] == buyer.pubkey()
+    assert transaction.message.recent_blockhash == adapter._blockhash
+    transaction.verify()
+
+    data = transaction.message.instructions[0].data
+    discriminator, lamports, min_tokens_out = struct.unpack("<BQQ", data)
+    assert discriminator == 0
+    assert lamports == 500_000_000
+    assert 0 < min_tokens_out < await adapter.quote_buy(MINT, 0.5)
+
+
+async def test_buy_token_rechecks_allowlist_after_change():
+    """Test that removing the program from the allowlist blocks buys"""
+    adapter = PumpFunAdapter()
+    adapter.allowlist.remove_program(adapter.get_program_id())
+
+    with pytest.raises(ValueError):
+        await adapter.buy_token(Keypair(), MINT, 0.5, 0.05)
+
+
+class FakeWebsocket:
+    """Websocket stand-in that delivers a fixed batch of messages, then closes"""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.subscribed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def account_subscribe(self, pubkey, commitment=None, encoding=None):
+        self.subscribed.append(pubkey)
+
+    async def recv(self):
+        return []  # subscription confirmation
+
+    async def __aiter__(self):
+        yield self.messages
+
+
+def make_curve_notification(adapter: PumpFunAdapter, data: bytes) -> AccountNotification:
+    """Build a websocket notification for a bonding curve account"""
+    return AccountNotification(
+        AccountNotificationResult(
+            Account(
+                lamports=1,
+                data=data,
+                owner=adapter.get_program_id(),
+                executable=False,
+                rent_epoch=0
+            ),
+            RpcResponseContext(1)
+        ),
+        1
+    )
+
+
+async def test_subscribe_curve_reconnects_after_close(monkeypatch):
+    """Test that curve updates keep flowing across bad updates and a normal close"""
+    adapter = PumpFunAdapter()
+    data = make_curve_data(1_073_000_000_000_000, 30_000_000_000, 0, 0, 1_000_000_000_000_000)
+    websockets = []
+
+    def fake_connect(url):
+        websockets.append(FakeWebsocket([
+            make_curve_notification(adapter, bytes(16)),  # malformed, skipped
+            make_curve_notification(adapter, data),
+        ]))
+        return websockets[-1]
+
+    monkeypatch.setattr(pumpfun_adapter, "ws_connect", fake_connect)
+    monkeypatch.setattr(pumpfun_adapter, "SUBSCRIBE_RECONNECT_DELAY", 0)
+    updates = []
+    two_updates = asyncio.Event()
+
+    def callback(curve_data):
+        updates.append(curve_data)
+        if len(updates) == 2:
+            two_updates.set()
+
+    task = asyncio.create_task(adapter.subscribe_curve(MINT, callback))
+    await asyncio.wait_for(two_updates.wait(), timeout=1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(websockets) >= 2
+    assert websockets[0].subscribed == [adapter._bonding_curve_pda(MINT)]
+    assert updates[0].virtual_sol_reserves == 30_000_000_000
+
+
+class FakeBlockhashClient:
+    """RPC client stand-in serving a new blockhash on every call"""
+
+    def __init__(self):
+        self.calls = 0
+        self.blockhashes = []
+        self.closed = False
+
+    async def get_latest_blockhash(self, commitment=None):
+        self.calls += 1
+        self.blockhashes.append(Hash.new_unique())
+        return SimpleNamespace(value=SimpleNamespace(blockhash=self.blockhashes[-1]))
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_blockhash_updater_refreshes_cache():
+    """Test that the background task fills the cache and stops on disconnect"""
+    client = FakeBlockhashClient()
+    adapter = PumpFunAdapter(client=client)
+
+    await adapter.connect()
+    for _ in range(100):
+        if client.calls:
+            break
+        await asyncio.sleep(0)
+    task = adapter._blockhash_task
+
+    assert adapter._blockhash == client.blockhashes[-1]
+    assert await adapter.get_cached_blockhash() == client.blockhashes[-1]
+    assert client.calls == 1
+
+    await adapter.disconnect()
+    assert task.cancelled()
+    assert adapter._blockhash_task is None
+    assert adapter._blockhash is None
+
+
+async def test_get_cached_blockhash_refetches_when_stale():
+    """Test that a stale or missing cached blockhash falls back to an RPC"""
+    client = FakeBlockhashClient()
+    adapter = PumpFunAdapter(client=client)
+
+    assert await adapter.get_cached_blockhash() == client.blockhashes[0]
+
+    adapter._blockhash_ts -= pumpfun_adapter.BLOCKHASH_MAX_AGE + 1
+    assert await adapter.get_cached_blockhash() == client.blockhashes[1]
+    assert client.calls == 2
+
+
+def test_build_sell_instruction_rounds_token_amount():
+    """Test that whole-token amounts are rounded, not truncated, to base units"""
+    adapter = PumpFunAdapter()
+
+    instruction = adapter._build_sell_instruction(Pubkey.new_unique(), MINT, 1.005, 0.05)
+
+    _, tokens, _ = struct.unpack("<BQQ", instruction.data)
+    assert tokens == 1_005_000
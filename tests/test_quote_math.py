@@ -0,0 +1,72 @@
+"""
+Tests for bonding curve quote math
+"""
+
+from src.adapters.base_adapter import PRICE_SCALE
+from src.adapters.quote_math import (
+    buy_quote, sell_quote, min_output, curve_metrics, sol_to_lamports, to_base_units
+)
+
+VSOL = 30_000_000_000               # 30 SOL
+VTOK = 1_073_000_000_000_000        # 1.073B tokens (6 decimals)
+
+
+def test_buy_quote():
+    """Test buy quote against the constant-product formula"""
+    sol_in = 1_000_000_000
+    tokens_out = buy_quote(VSOL, VTOK, sol_in)
+
+    # Curve invariant must not decrease
+    assert (VSOL + sol_in) * (VTOK - tokens_out) >= VSOL * VTOK
+    # Spending more yields more tokens
+    assert buy_quote(VSOL, VTOK, 2 * sol_in) > tokens_out
+
+
+def test_sell_quote():
+    """Test sell quote against the constant-product formula"""
+    tokens_in = 10_000_000_000_000
+    sol_out = sell_quote(VSOL, VTOK, tokens_in)
+
+    assert (VSOL - sol_out) * (VTOK + tokens_in) >= VSOL * VTOK
+    assert 0 < sol_out < VSOL
+
+
+def test_round_trip_does_not_profit():
+    """Test that buying then selling never returns more SOL"""
+    sol_in = 500_000_000
+    tokens_out = buy_quote(VSOL, VTOK, sol_in)
+    sol_back = sell_quote(VSOL + sol_in, VTOK - tokens_out, tokens_out)
+
+    assert sol_back <= sol_in
+
+
+def test_zero_input():
+    """Test zero and negative inputs"""
+    assert buy_quote(VSOL, VTOK, 0) == 0
+    assert sell_quote(VSOL, VTOK, -1) == 0
+
+
+def test_min_output():
+    """Test slippage floor"""
+    assert min_output(10_000, 0.05) == 9_500
+    assert min_output(10_000, 0.0) == 10_000
+
+
+def test_curve_metrics():
+    """Test spot price and market cap in fixed-point units"""
+    price, slope, market_cap = curve_metrics(VSOL, VTOK, 1_000_000_000_000_000, 6)
+
+    # 30 SOL / 1.073B tokens, per whole token, scaled by PRICE_SCALE
+    assert price == VSOL * 10 ** 6 * PRICE_SCALE // VTOK
+    assert market_cap == price * 1_000_000_000 // PRICE_SCALE
+    assert slope > 0
+    assert curve_metrics(VSOL, 0, 1, 6) == (0, 0.0, 0)
+
+
+def test_unit_conversion_rounds_float_products():
+    """Test that whole-unit amounts convert without losing a base unit"""
+    # int() truncates these float products one base unit short
+    assert to_base_units(1.005, 6) == 1_005_000
+    assert to_base_units(1.003, 6) == 1_003_000
+    assert sol_to_lamports(1.005) == 1_005_000_000
+    assert sol_to_lamports(0.5) == 500_000_000
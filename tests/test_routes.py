@@ -0,0 +1,133 @@
+"""
+Tests for API routes
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.base_adapter import TokenInfo
+from src.api import routes
+from src.config.settings import Settings
+from src.utils.pubkey import pubkey_from_string
+
+MINT = "So11111111111111111111111111111111111111112"
+
+
+class StubClient:
+    """RPC client stand-in that records whether it was closed"""
+    
+    def __init__(self):
+        self.closed = False
+    
+    async def get_latest_blockhash(self, commitment=None):
+        raise ConnectionError("no RPC in tests")
+    
+    async def close(self):
+        self.closed = True
+
+
+def make_app() -> FastAPI:
+    """Build an app around the routes module's lifespan and router"""
+    app = FastAPI(lifespan=routes.lifespan)
+    app.include_router(routes.router)
+    return app
+
+
+def test_lifespan_creates_fresh_client_per_startup(monkeypatch):
+    """Test that a second start-up does not reuse the closed client"""
+    created = []
+    
+    def create_client(rpc_url):
+        created.append(StubClient())
+        return created[-1]
+    
+    monkeypatch.setattr(routes, "create_rpc_client", create_client)
+    app = make_app()
+    
+    for _ in range(2):
+        with TestClient(app):
+            client = created[-1]
+            assert not client.closed
+            assert routes.get_adapter("pumpfun").client is client
+            assert routes.get_adapter("bonkfun").client is client
+            assert not routes.get_adapter("pumpfun")._owns_client
+        assert client.closed
+    
+    assert len(created) == 2
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    """TestClient for the routes, with a stub RPC client"""
+    monkeypatch.setattr(routes, "create_rpc_client", lambda rpc_url: StubClient())
+    with TestClient(make_app()) as client:
+        yield client
+
+
+def test_buy_token_rejects_invalid_mint(api_client):
+    """Test that an unparsable token mint fails request validation"""
+    response = api_client.post("/api/v1/launchpad/buy-token", json={
+        "launchpad": "pumpfun",
+        "token_mint": "not-a-mint",
+        "sol_amount": 0.5,
+        "wallet_keypair": "",
+    })
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "token_mint"]
+
+
+def test_get_launchpads_response_shape(api_client):
+    """Test the supported launchpads payload"""
+    response = api_client.get("/api/v1/launchpad/launchpads")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "launchpads": [
+            {
+                "name": "pumpfun",
+                "display_name": "Pump.fun",
+                "program_id": str(Settings.PUMP_FUN_PROGRAM_PUBKEY),
+                "supported": True,
+            },
+            {
+                "name": "bonkfun",
+                "display_name": "Bonk.fun",
+                "program_id": str(Settings.BONK_FUN_PROGRAM_PUBKEY),
+                "supported": False,
+            },
+        ]
+    }
+
+
+@pytest.mark.parametrize("path", [
+    f"/api/v1/launchpad/curve-data/unknown/{MINT}",
+    f"/api/v1/launchpad/token-info/unknown/{MINT}",
+])
+def test_unknown_launchpad_returns_400(api_client, path):
+    """Test that an unknown launchpad name is a client error"""
+    response = api_client.get(path)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown launchpad: unknown"}
+
+
+def test_launchpad_lookup_is_case_insensitive(api_client):
+    """Test that launchpad names match regardless of case"""
+    assert routes.get_adapter("PumpFun") is routes.get_adapter("pumpfun")
+    assert routes.get_adapter("bonk.fun") is routes.get_adapter("bonkfun")
+
+
+def test_token_info_served_from_cache(api_client):
+    """Test that the token-info route reads through the token cache"""
+    mint = pubkey_from_string(MINT)
+    routes.get_adapter("pumpfun").token_cache.put(
+        TokenInfo(mint=mint, symbol="EVL", name="Evalys", decimals=6)
+    )
+
+    # The stub RPC client cannot serve accounts, so this must be a cache hit
+    response = api_client.get(f"/api/v1/launchpad/token-info/pumpfun/{MINT}")
+
+    assert response.status_code == 200
+    assert response.json()["symbol"] == "EVL"
+    assert response.json()["decimals"] == 6
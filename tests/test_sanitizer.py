@@ -0,0 +1,50 @@
+"""
+Tests for behavior sanitizer
+"""
+
+from solders.instruction import AccountMeta, Instruction
+from solders.pubkey import Pubkey
+from src.safety.sanitizer import BehaviorSanitizer
+
+PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
+
+def test_normalize_accounts_sorts_by_pubkey():
+    """Test that accounts are reordered by public key"""
+    sanitizer = BehaviorSanitizer()
+    accounts = [
+        AccountMeta(pubkey=Pubkey.new_unique(), is_signer=False, is_writable=True)
+        for _ in range(5)
+    ]
+    instruction = Instruction(PROGRAM_ID, bytes([1, 2, 3]), list(reversed(accounts)))
+
+    normalized = sanitizer.normalize_accounts(instruction)
+
+    assert [bytes(acc.pubkey) for acc in normalized.accounts] == sorted(
+        bytes(acc.pubkey) for acc in accounts
+    )
+    assert normalized.program_id == PROGRAM_ID
+    assert normalized.data == instruction.data
+
+
+def test_disabled_sanitizer_returns_instruction_unchanged():
+    """Test that a disabled sanitizer passes instructions through"""
+    sanitizer = BehaviorSanitizer(enabled=False)
+    instruction = Instruction(PROGRAM_ID, bytes([1]), [])
+
+    assert sanitizer.sanitize_instruction(instruction) is instruction
+
+
+def test_normalize_accounts_returns_sorted_instruction_unchanged():
+    """Test that already-normalized instructions are not rebuilt"""
+    sanitizer = BehaviorSanitizer()
+    accounts = sorted(
+        (
+            AccountMeta(pubkey=Pubkey.new_unique(), is_signer=False, is_writable=True)
+            for _ in range(5)
+        ),
+        key=lambda acc: bytes(acc.pubkey)
+    )
+    instruction = Instruction(PROGRAM_ID, bytes([1, 2, 3]), accounts)
+
+    assert sanitizer.normalize_accounts(instruction) is instruction
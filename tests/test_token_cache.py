@@ -0,0 +1,94 @@
+"""
+Tests for token info cache
+"""
+
+import sqlite3
+from solders.pubkey import Pubkey
+from src.adapters.base_adapter import TokenInfo
+from src.adapters.generic_adapter import GenericAdapter
+from src.adapters.token_cache import SCHEMA_VERSION, TokenInfoCache
+
+MINT = Pubkey.from_string("11111111111111111111111111111111")
+
+
+def test_cache_miss():
+    """Test lookup of an unknown mint"""
+    cache = TokenInfoCache()
+    assert cache.get(MINT) is None
+
+
+def test_put_and_get():
+    """Test storing and reading token info"""
+    cache = TokenInfoCache()
+    cache.put(TokenInfo(mint=MINT, symbol="EVL", name="Evalys", uri="https://example.com"))
+
+    token_info = cache.get(MINT)
+    assert token_info is not None
+    assert token_info.mint == MINT
+    assert token_info.symbol == "EVL"
+    assert token_info.name == "Evalys"
+    assert token_info.uri == "https://example.com"
+
+
+def test_expired_entry():
+    """Test that expired entries are not returned"""
+    cache = TokenInfoCache(ttl=-1)
+    cache.put(TokenInfo(mint=MINT, symbol="EVL", name="Evalys"))
+    assert cache.get(MINT) is None
+
+
+def test_persists_to_disk(tmp_path):
+    """Test that entries survive reopening the cache"""
+    path = str(tmp_path / "tokens.db")
+    cache = TokenInfoCache(path)
+    cache.put(TokenInfo(mint=MINT, symbol="EVL", name="Evalys"))
+    cache.close()
+
+    reopened = TokenInfoCache(path)
+    assert reopened.get(MINT).symbol == "EVL"
+
+
+def test_invalidate():
+    """Test removing a cached entry"""
+    cache = TokenInfoCache()
+    cache.put(TokenInfo(mint=MINT, symbol="EVL", name="Evalys"))
+
+    cache.invalidate(MINT)
+    assert cache.get(MINT) is None
+
+
+async def test_adapter_uses_cache():
+    """Test that adapters serve cached token info"""
+    cache = TokenInfoCache()
+    cache.put(TokenInfo(mint=MINT, symbol="EVL", name="Evalys"))
+    adapter = GenericAdapter(MINT, token_cache=cache)
+
+    token_info = await adapter.get_token_info_cached(MINT)
+    assert token_info.symbol == "EVL"
+
+
+def test_file_cache_uses_wal(tmp_path):
+    """Test that file-backed caches skip the per-commit fsync"""
+    cache = TokenInfoCache(str(tmp_path / "tokens.db"))
+
+    (journal_mode,) = cache._conn.execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == "wal"
+
+
+def test_rebuilds_cache_from_older_schema(tmp_path):
+    """Test that a cache file without the decimals column is rebuilt"""
+    path = str(tmp_path / "tokens.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE token_info (mint TEXT PRIMARY KEY, symbol TEXT NOT NULL, "
+        "name TEXT NOT NULL, uri TEXT, created_at REAL, fetched_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO token_info VALUES (?, 'OLD', 'Old', NULL, NULL, 0)", (str(MINT),))
+    conn.commit()
+    conn.close()
+
+    cache = TokenInfoCache(path)
+    assert cache.get(MINT) is None
+    cache.put(TokenInfo(mint=MINT, symbol="EVL", name="Evalys", decimals=6))
+    assert cache.get(MINT).decimals == 6
+    assert cache._conn.execute("PRAGMA user_version").fetchone() == (SCHEMA_VERSION,)
@@ -0,0 +1,46 @@
+"""
+Tests for instruction validator
+"""
+
+import pytest
+from solders.instruction import AccountMeta, Instruction
+from solders.pubkey import Pubkey
+from src.safety.validator import InstructionValidator
+
+PROGRAM_ID = Pubkey.new_unique()
+
+
+def make_instruction(program_id: Pubkey) -> Instruction:
+    """Build a one-account instruction"""
+    return Instruction(program_id, bytes([1]), [AccountMeta(Pubkey.new_unique(), True, True)])
+
+
+def test_validate_instruction_uses_default_program():
+    """Test validating against the program given at construction"""
+    validator = InstructionValidator(PROGRAM_ID)
+
+    validator.validate_instruction(make_instruction(PROGRAM_ID))
+
+    with pytest.raises(ValueError):
+        validator.validate_instruction(make_instruction(Pubkey.new_unique()))
+
+
+def test_validate_instruction_requires_program():
+    """Test that a validator without a default needs an explicit program"""
+    validator = InstructionValidator()
+
+    validator.validate_instruction(make_instruction(PROGRAM_ID), PROGRAM_ID)
+
+    with pytest.raises(ValueError):
+        validator.validate_instruction(make_instruction(PROGRAM_ID))
+
+
+def test_validate_accounts():
+    """Test the minimum account count check"""
+    validator = InstructionValidator()
+    instruction = make_instruction(PROGRAM_ID)
+
+    validator.validate_accounts(instruction, 1)
+
+    with pytest.raises(ValueError, match="has 1 accounts"):
+        validator.validate_accounts(instruction, 2)